@@ -0,0 +1,37 @@
+# Shared HTTP session for AOTY Crawler
+# Pooled keep-alive session for synchronous side-channel requests
+#
+# Scrapy handles the crawl itself; this session is for auxiliary
+# synchronous fetches (cover-image HEAD checks, cross-references, ...)
+# that would otherwise pay a fresh TCP + TLS handshake per call.
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session = None
+
+
+def get_session():
+    """Return the shared pooled session, creating it on first use"""
+    global _session
+
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=3,
+        )
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+
+    return _session
+
+
+def close_session():
+    """Close the shared session (mainly for tests and clean shutdown)"""
+    global _session
+
+    if _session is not None:
+        _session.close()
+        _session = None
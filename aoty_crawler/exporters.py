@@ -0,0 +1,34 @@
+# Item exporters for AOTY Crawler
+# Custom Scrapy exporters for faster output serialization
+
+import json
+
+from scrapy.exporters import BaseItemExporter
+
+# Optional native JSON serializer - ~5x stdlib json on the encode path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonLinesItemExporter(BaseItemExporter):
+    """JSON Lines exporter backed by orjson
+
+    One record per line means each item is flushed independently - no
+    whole-array rewrite or bracket fixup when the feed closes - and
+    orjson's C serializer handles the encoding. Falls back to stdlib
+    json when orjson is unavailable.
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+
+    def export_item(self, item):
+        itemdict = dict(self._get_serialized_fields(item))
+        if orjson is not None:
+            self.file.write(orjson.dumps(itemdict, default=str,
+                                         option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            self.file.write(json.dumps(itemdict, default=str).encode('utf-8') + b'\n')
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Precompiled URL and markup regex patterns shared by the spiders
+
+Compiling here gives every consumer the same singleton re.Pattern, so
+per-link classification skips the module-cache lookup `re.search(str, ...)`
+pays on each call.
+"""
+
+import re
+
+# Extracts the slug from genre URLs like /genre/7-rock/ -> "rock"
+GENRE_SLUG_RE = re.compile(r'/genre/\d+-(.+)/')
+
+# Extracts the AOTY ID from album URLs like /album/123456-album-name.php
+ALBUM_ID_RE = re.compile(r'/album/(\d+-[^/]+)\.php')
+
+# "Month D, YYYY" between tags in a serialized detail row
+DATE_RE = re.compile(r'>([A-Za-z]+)\s+(\d+),\s+(\d{4})<')
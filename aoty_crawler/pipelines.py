@@ -8,6 +8,12 @@ import os
 from datetime import datetime
 from scrapy.exceptions import DropItem
 
+# Optional native JSON serializer for the output dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # File-based storage configuration
@@ -15,6 +21,16 @@ logger = logging.getLogger(__name__)
 OUTPUT_DIR = os.environ.get('OUTPUT_DIR', 'data/output')
 
 
+def _dump_json(path, data):
+    """Write a list of item dicts as an indented JSON array file"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
 class FileStoragePipeline:
     """
     Pipeline to store scraped items as JSON and CSV files
@@ -70,8 +86,7 @@ class FileStoragePipeline:
             # JSON output
             albums_json_file = os.path.join(output_dir, f'albums_{timestamp}.json')
             try:
-                with open(albums_json_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.albums, f, indent=2, default=str)
+                _dump_json(albums_json_file, self.albums)
                 logger.info(f"✓ Saved {len(self.albums)} albums to JSON: {albums_json_file}")
                 files_written += 1
             except Exception as e:
@@ -91,8 +106,7 @@ class FileStoragePipeline:
         if self.artists:
             artists_json_file = os.path.join(output_dir, f'artists_{timestamp}.json')
             try:
-                with open(artists_json_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.artists, f, indent=2, default=str)
+                _dump_json(artists_json_file, self.artists)
                 logger.info(f"✓ Saved {len(self.artists)} artists to JSON: {artists_json_file}")
                 files_written += 1
             except Exception as e:
@@ -111,8 +125,7 @@ class FileStoragePipeline:
         if self.genres:
             genres_json_file = os.path.join(output_dir, f'genres_{timestamp}.json')
             try:
-                with open(genres_json_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.genres, f, indent=2, default=str)
+                _dump_json(genres_json_file, self.genres)
                 logger.info(f"✓ Saved {len(self.genres)} genres to JSON: {genres_json_file}")
                 files_written += 1
             except Exception as e:
@@ -131,8 +144,7 @@ class FileStoragePipeline:
         if self.reviews:
             reviews_json_file = os.path.join(output_dir, f'reviews_{timestamp}.json')
             try:
-                with open(reviews_json_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.reviews, f, indent=2, default=str)
+                _dump_json(reviews_json_file, self.reviews)
                 logger.info(f"✓ Saved {len(self.reviews)} reviews to JSON: {reviews_json_file}")
                 files_written += 1
             except Exception as e:
@@ -402,7 +414,13 @@ class ValidationPipeline:
     """
     Pipeline to validate scraped data
     """
-    
+
+    # Placeholder values that show up when a non-album page (corrections
+    # form, discography listing) was parsed as an album. Dropping them
+    # here means the data loaders never see them.
+    PLACEHOLDER_ARTISTS = frozenset(('submit correction', 'album', 'artist', 'unknown'))
+    PLACEHOLDER_TITLES = frozenset(('discography', 'album', 'artist', 'unknown'))
+
     def process_item(self, item, spider):
         """Validate item data"""
         # Validate required fields for albums
@@ -413,6 +431,15 @@ class ValidationPipeline:
                 raise DropItem("Album missing title")
             if not item.get('url'):
                 raise DropItem("Album missing URL")
+
+            # Reject placeholder entries at scrape time instead of filtering
+            # them out of every data load
+            artist = (item.get('artist_name') or '').strip().lower()
+            title = (item.get('title') or '').strip().lower()
+            if artist in self.PLACEHOLDER_ARTISTS:
+                raise DropItem(f"Album has placeholder artist: {item.get('artist_name')}")
+            if title in self.PLACEHOLDER_TITLES:
+                raise DropItem(f"Album has placeholder title: {item.get('title')}")
         
         # Validate required fields for artists
         if 'aoty_id' in item and 'name' in item:
@@ -100,6 +100,12 @@ REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
 
+# Use the orjson-backed JSON Lines exporter for -O output.jsonl feeds
+FEED_EXPORTERS = {
+    "jsonl": "aoty_crawler.exporters.OrjsonLinesItemExporter",
+    "jsonlines": "aoty_crawler.exporters.OrjsonLinesItemExporter",
+}
+
 # Retry settings
 RETRY_ENABLED = True
 RETRY_TIMES = 3
@@ -6,8 +6,10 @@ Based on HTML structure analysis from debug files
 
 import scrapy
 import re
+import sys
 from datetime import datetime
 from aoty_crawler.items import AlbumItem
+from aoty_crawler.patterns import ALBUM_ID_RE, DATE_RE
 
 
 class ComprehensiveAlbumSpider(scrapy.Spider):
@@ -43,105 +45,148 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
         
         # Extract AOTY ID from URL
         album['aoty_id'] = self._extract_aoty_id(response.url)
-        
+
+        # Collect all <head> meta tags once for the meta-based fallbacks
+        meta_tags = self._collect_meta_tags(response)
+
+        # Locate the known container subtrees once; the detail/score
+        # extractions below query these small fragments instead of
+        # re-walking the whole document per field
+        detail_rows = response.css('.detailRow')
+        critic_box = response.css('.albumCriticScoreBox')
+        user_box = response.css('.albumUserScoreBox')
+
         # 1. Extract Album Title
-        album['title'] = self._extract_album_title(response)
-        
+        album['title'] = self._extract_album_title(response, meta_tags)
+
         # 2. Extract Artist Name
-        album['artist_name'] = self._extract_artist_name(response)
-        
+        album['artist_name'] = self._extract_artist_name(response, meta_tags)
+
         # 3. Extract Release Date
-        album['release_date'] = self._extract_release_date(response)
-        
+        album['release_date'] = self._extract_release_date(detail_rows)
+
         # 4. Extract Critic Score
         album['critic_score'] = self._extract_critic_score(response)
-        
+
         # 5. Extract User Score
         album['user_score'] = self._extract_user_score(response)
-        
+
         # 6. Extract Critic Review Count
-        album['critic_review_count'] = self._extract_critic_review_count(response)
-        
+        album['critic_review_count'] = self._extract_critic_review_count(critic_box, meta_tags)
+
         # 7. Extract User Review Count
-        album['user_review_count'] = self._extract_user_review_count(response)
-        
+        album['user_review_count'] = self._extract_user_review_count(user_box)
+
         # 8. Extract Genres
-        album['genres'] = self._extract_genres(response)
-        
+        album['genres'] = self._extract_genres(detail_rows, meta_tags)
+
         # 9. Extract Genre Tags (secondary genres)
-        album['genre_tags'] = self._extract_genre_tags(response)
-        
+        album['genre_tags'] = self._extract_genre_tags(detail_rows)
+
         # 10. Extract Cover Image URL
-        album['cover_image_url'] = self._extract_cover_image(response)
-        
+        album['cover_image_url'] = self._extract_cover_image(response, meta_tags)
+
         # 11. Extract Description
-        album['description'] = self._extract_description(response)
+        album['description'] = self._extract_description(meta_tags)
         
         # Log what we found
         self._log_extraction_results(album)
         
         yield album
     
-    def _extract_aoty_id(self, url):
+    @staticmethod
+    def _extract_aoty_id(url):
         """Extract AOTY ID from URL"""
         # URL format: https://www.albumoftheyear.org/album/123456-album-name.php
-        match = re.search(r'/album/(\d+-[^/]+)\.php', url)
+        match = ALBUM_ID_RE.search(url)
         if match:
             return match.group(1)
         return None
     
-    def _extract_album_title(self, response):
+    @staticmethod
+    def _collect_meta_tags(response):
+        """Collect all <head> meta tags into a dict in one bounded traversal
+
+        The meta-based fallbacks (og:title, og:image, Description, reviewCount,
+        genre, ...) would otherwise each walk the full DOM even though every
+        <meta> tag lives under <head>. itemprop="genre" can appear multiple
+        times, so it accumulates a list.
+        """
+        meta_tags = {}
+        head = response.selector.root.find('head')
+        if head is None:
+            return meta_tags
+
+        for tag in head.iterfind('meta'):
+            key = tag.get('property') or tag.get('name') or tag.get('itemprop')
+            content = tag.get('content')
+            if not key or content is None:
+                continue
+            if key == 'genre':
+                meta_tags.setdefault('genre', []).append(content)
+            elif key not in meta_tags:
+                meta_tags[key] = content
+
+        return meta_tags
+
+    @staticmethod
+    def _extract_album_title(response, meta_tags):
         """Extract album title"""
-        # Try multiple selectors
-        selectors = [
-            'h1.albumTitle span[itemprop="name"]::text',
-            'meta[property="og:title"]::attr(content)',
-            'h1::text',
-        ]
-        
-        for selector in selectors:
-            title = response.css(selector).get()
-            if title:
-                # Clean up if from og:title (Artist - Album format)
-                if ' - ' in title:
-                    title = title.split(' - ', 1)[1].strip()
-                return title.strip()
-        
+        # Try page heading first, then og:title, then any h1
+        title = response.css('h1.albumTitle span[itemprop="name"]::text').get()
+        if not title:
+            title = meta_tags.get('og:title')
+        if not title:
+            title = response.css('h1::text').get()
+
+        if title:
+            # Clean up if from og:title (Artist - Album format)
+            if ' - ' in title:
+                title = title.split(' - ', 1)[1].strip()
+            return title.strip()
+
         return None
-    
-    def _extract_artist_name(self, response):
+
+    @staticmethod
+    def _extract_artist_name(response, meta_tags):
         """Extract artist name"""
-        selectors = [
-            '[itemprop="byArtist"] span[itemprop="name"] a::text',
-            '.artist a::text',
-            'meta[property="og:title"]::attr(content)',
-        ]
-        
-        for selector in selectors:
-            artist = response.css(selector).get()
-            if artist:
-                # Clean up if from og:title (Artist - Album format)
-                if ' - ' in artist:
-                    artist = artist.split(' - ', 1)[0].strip()
-                # Filter out non-artist names
-                if artist.lower() not in ['discography', 'submit correction']:
-                    return artist.strip()
-        
+        artist = response.css('[itemprop="byArtist"] span[itemprop="name"] a::text').get()
+        if not artist:
+            artist = response.css('.artist a::text').get()
+        if not artist:
+            artist = meta_tags.get('og:title')
+
+        if artist:
+            # Clean up if from og:title (Artist - Album format)
+            if ' - ' in artist:
+                artist = artist.split(' - ', 1)[0].strip()
+            # Filter out non-artist names
+            if artist.lower() not in ['discography', 'submit correction']:
+                return artist.strip()
+
         return None
     
-    def _extract_release_date(self, response):
+    @staticmethod
+    def _extract_release_date(detail_rows):
         """Extract release date"""
-        # Look for release date in detail row
-        release_text = response.css('.detailRow:contains("Release Date")').get()
+        # Look for the release date row; test the row text via lxml's
+        # text_content() and serialize only the row that matches (the old
+        # :contains() selector re-walked the whole document)
+        release_text = None
+        for row in detail_rows:
+            if 'Release Date' in row.root.text_content():
+                release_text = row.get()
+                break
+
         if release_text:
             # Extract date using regex
-            date_match = re.search(r'>([A-Za-z]+)\s+(\d+),\s+(\d{4})<', release_text)
+            date_match = DATE_RE.search(release_text)
             if date_match:
                 month, day, year = date_match.groups()
                 return f"{month} {day}, {year}"
-        
+
         # Try alternative: look for date links
-        date_parts = response.css('.detailRow a[href*="/releases/"]::text').getall()
+        date_parts = detail_rows.css('a[href*="/releases/"]::text').getall()
         if len(date_parts) >= 2:
             month = date_parts[0]
             year = date_parts[1].strip()
@@ -149,10 +194,11 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
             day_match = re.search(r'>(\d+),<', release_text or '')
             day = day_match.group(1) if day_match else "1"
             return f"{month} {day}, {year}"
-        
+
         return None
     
-    def _extract_critic_score(self, response):
+    @staticmethod
+    def _extract_critic_score(response):
         """Extract critic score"""
         score = response.css('[itemprop="ratingValue"] a::text').get()
         if score:
@@ -162,7 +208,8 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
                 return None
         return None
     
-    def _extract_user_score(self, response):
+    @staticmethod
+    def _extract_user_score(response):
         """Extract user score"""
         score = response.css('.albumUserScore a::text').get()
         if score:
@@ -171,37 +218,42 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
             except ValueError:
                 return None
         
-        # Alternative: look for .rating divs
-        ratings = response.css('.rating::text').getall()
-        for rating in ratings:
-            if rating.strip() and rating.strip() != 'NR':
-                try:
-                    return float(rating.strip())
-                except ValueError:
-                    continue
-        
+        # Alternative: first non-empty, non-'NR' .rating text
+        # Selected lazily in XPath so lxml stops at the first match instead
+        # of materializing every .rating text on the page
+        rating = response.xpath(
+            '(//*[contains(@class, "rating")]/text()'
+            '[normalize-space(.) and normalize-space(.) != "NR"])[1]'
+        ).get()
+        if rating:
+            try:
+                return float(rating.strip())
+            except ValueError:
+                pass
+
         return None
     
-    def _extract_critic_review_count(self, response):
+    @staticmethod
+    def _extract_critic_review_count(critic_box, meta_tags):
         """Extract critic review count"""
         # Try meta tag first
-        count = response.css('meta[itemprop="reviewCount"]::attr(content)').get()
+        count = meta_tags.get('reviewCount')
         if count:
             try:
                 return int(count)
             except ValueError:
                 pass
-        
+
         # Try span tag
-        count = response.css('span[itemprop="ratingCount"]::text').get()
+        count = critic_box.css('span[itemprop="ratingCount"]::text').get()
         if count:
             try:
                 return int(count)
             except ValueError:
                 pass
-        
+
         # Try text extraction
-        text = response.css('.albumCriticScoreBox .numReviews::text').get()
+        text = critic_box.css('.numReviews::text').get()
         if text:
             match = re.search(r'(\d+)', text)
             if match:
@@ -212,18 +264,22 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
         
         return None
     
-    def _extract_user_review_count(self, response):
+    @staticmethod
+    def _extract_user_review_count(user_box):
         """Extract user review count"""
         # Look in user score box
-        text = response.css('.albumUserScoreBox .numReviews strong::text').get()
+        text = user_box.css('.numReviews strong::text').get()
         if text:
             try:
                 return int(text)
             except ValueError:
                 pass
-        
-        # Alternative: extract from link text
-        link_text = response.css('.albumUserScoreBox .numReviews a::text').get()
+
+        # Alternative: first numeric link text, matched in XPath via the
+        # EXSLT re: namespace (parsel registers it by default)
+        link_text = user_box.xpath(
+            '(.//*[contains(@class, "numReviews")]//a/text()[re:test(., "\\d")])[1]'
+        ).get()
         if link_text:
             match = re.search(r'(\d+)', link_text)
             if match:
@@ -231,22 +287,24 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
                     return int(match.group(1))
                 except ValueError:
                     pass
-        
+
         return None
     
-    def _extract_genres(self, response):
+    @staticmethod
+    def _extract_genres(detail_rows, meta_tags):
         """Extract primary genres"""
         genres = []
-        
+
         # Extract from meta tags
-        meta_genres = response.css('meta[itemprop="genre"]::attr(content)').getall()
-        genres.extend(meta_genres)
-        
+        # Intern genre names: the same handful of strings recur across
+        # thousands of album pages, so each distinct genre lives once
+        genres.extend(sys.intern(g) for g in meta_tags.get('genre', []))
+
         # Extract from genre links (primary)
-        genre_links = response.css('.detailRow a[href*="/genre/"]::text').getall()
+        genre_links = detail_rows.css('a[href*="/genre/"]::text').getall()
         for genre in genre_links:
             if genre and genre not in genres:
-                genres.append(genre.strip())
+                genres.append(sys.intern(genre.strip()))
         
         # Remove duplicates while preserving order
         seen = set()
@@ -258,42 +316,31 @@ class ComprehensiveAlbumSpider(scrapy.Spider):
         
         return unique_genres if unique_genres else None
     
-    def _extract_genre_tags(self, response):
+    @staticmethod
+    def _extract_genre_tags(detail_rows):
         """Extract secondary genre tags"""
-        tags = response.css('.detailRow .secondary::text').getall()
+        tags = detail_rows.css('.secondary::text').getall()
         if tags:
-            return [tag.strip() for tag in tags if tag.strip()]
+            return [sys.intern(tag.strip()) for tag in tags if tag.strip()]
         return None
     
-    def _extract_cover_image(self, response):
+    @staticmethod
+    def _extract_cover_image(response, meta_tags):
         """Extract cover image URL"""
-        # Try multiple selectors
-        selectors = [
-            '.albumTopBox.cover img::attr(src)',
-            'meta[property="og:image"]::attr(content)',
-            'img[alt*=" - "]::attr(src)',  # Alt text often contains "Artist - Album"
-        ]
-        
-        for selector in selectors:
-            image = response.css(selector).get()
-            if image:
-                return image
-        
-        return None
-    
-    def _extract_description(self, response):
+        image = response.css('.albumTopBox.cover img::attr(src)').get()
+        if not image:
+            image = meta_tags.get('og:image')
+        if not image:
+            # Alt text often contains "Artist - Album"
+            image = response.css('img[alt*=" - "]::attr(src)').get()
+
+        return image or None
+
+    @staticmethod
+    def _extract_description(meta_tags):
         """Extract album description"""
-        # Try meta description
-        desc = response.css('meta[name="Description"]::attr(content)').get()
-        if desc:
-            return desc
-        
-        # Try og:description
-        desc = response.css('meta[property="og:description"]::attr(content)').get()
-        if desc:
-            return desc
-        
-        return None
+        # Try meta description, then og:description
+        return meta_tags.get('Description') or meta_tags.get('og:description') or None
     
     def _log_extraction_results(self, album):
         """Log what data was extracted"""
@@ -6,16 +6,29 @@ Combines genre navigation with comprehensive album extraction
 
 import scrapy
 import re
+import sys
 import os
 import json
 from datetime import datetime
 from aoty_crawler.items import AlbumItem
+from aoty_crawler.patterns import ALBUM_ID_RE, DATE_RE, GENRE_SLUG_RE
+
+# Optional streaming JSON parser - resume files are scanned for URLs
+# without materializing the whole album list
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 class ProductionSpider(scrapy.Spider):
     name = "production"
     allowed_domains = ["albumoftheyear.org"]
-    
+
+    # All scraped hrefs are site-relative; plain concat avoids the
+    # urllib.parse round-trip response.urljoin pays per link
+    BASE_URL = "https://www.albumoftheyear.org"
+
     # Configuration (can be overridden via CLI)
     DEFAULT_START_YEAR = 2026
     DEFAULT_YEARS_BACK = 1
@@ -28,7 +41,7 @@ class ProductionSpider(scrapy.Spider):
         'ROBOTSTXT_OBEY': True,
         'CONCURRENT_REQUESTS': 1,
     }
-    
+
     def __init__(self, genre=None, start_year=None, years_back=None, 
                  albums_per_year=None, test_mode=False, resume=False, 
                  resume_file=None, *args, **kwargs):
@@ -41,13 +54,30 @@ class ProductionSpider(scrapy.Spider):
         self.albums_per_year = int(albums_per_year) if albums_per_year else self.DEFAULT_ALBUMS_PER_YEAR
         self.test_mode = test_mode
         self.resume_mode = resume
-        
+
+        # Candidate slug spellings for the target genre, built once.
+        # The per-link genre filter is then a single frozenset probe
+        # instead of a chain of string compares and .replace allocations.
+        if self.target_genre:
+            target = self.target_genre.lower()
+            self.target_slugs = frozenset((
+                target,
+                target.replace(' ', '-'),
+                target.replace('-', ' ').replace(' ', '-'),
+            ))
+        else:
+            self.target_slugs = frozenset()
+
         # Calculate year range
         self.end_year = self.start_year - self.years_back + 1
         
         # Track progress
         self.albums_scraped = 0
         self.genres_scraped = 0
+
+        # Stamp once per crawl; avoids a utcnow() syscall + datetime
+        # allocation for every album in parse_album_page
+        self.crawl_started_at = datetime.utcnow()
         
         # Resume functionality
         self.scraped_urls = set()
@@ -84,9 +114,14 @@ class ProductionSpider(scrapy.Spider):
             
             for filepath in files_to_check:
                 if os.path.exists(filepath):
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for album in data:
+                    # Only the URL of each album is needed; streaming keeps
+                    # peak memory at one album instead of the whole file
+                    with open(filepath, 'rb') as f:
+                        if ijson is not None:
+                            albums = ijson.items(f, 'item')
+                        else:
+                            albums = json.load(f)
+                        for album in albums:
                             if 'url' in album:
                                 self.scraped_urls.add(album['url'])
             
@@ -125,71 +160,57 @@ class ProductionSpider(scrapy.Spider):
     def parse_genre_page(self, response):
         """Parse genre page and extract genre links"""
         self.logger.info(f"Parsing genre page: {response.url}")
-        
+
         # Try to find "All Genres" section first
-        # Look for the "All Genres" heading and extract links from that section
-        all_genres_links = []
-        
+        # Select anchor nodes (not just hrefs) so href and text come out of a
+        # single XPath pass instead of a per-href document re-scan
+
         # Method 1: Look for "All Genres" heading and extract subsequent links
-        all_genres_heading = response.xpath('//*[contains(text(), "All Genres")]/following::a[contains(@href, "/genre/") and not(contains(text(), "View More")) and not(contains(text(), "similar artists")) and not(contains(text(), "follow"))]/@href').getall()
-        
-        if all_genres_heading:
-            self.logger.info(f"Found 'All Genres' section with {len(all_genres_heading)} genre links")
-            all_genres_links = all_genres_heading
+        genre_links = response.xpath('//*[contains(text(), "All Genres")]/following::a[contains(@href, "/genre/") and not(contains(text(), "View More")) and not(contains(text(), "similar artists")) and not(contains(text(), "follow"))]')
+
+        if genre_links:
+            self.logger.info(f"Found 'All Genres' section with {len(genre_links)} genre links")
         else:
-            # Method 2: Fallback - extract all genre links but filter more aggressively
+            # Method 2: Fallback - extract all genre links but filter more
+            # aggressively, with the genre-URL pattern matched in XPath via
+            # the EXSLT re: namespace (skips /genre/list and /genre.php)
             self.logger.info("'All Genres' section not found, using fallback method")
-            
-            # Get all genre links
-            all_links = response.css('a[href*="/genre/"]::attr(href)').getall()
-            
-            # Filter out common non-genre links
-            excluded_texts = ['view more', 'similar artists', 'follow', 'on this day', 'newsworthy', 'user updates', 'site updates', 'privacy policy', 'contact us', 'ad-free', 'highest rated', 'must hear albums', 'year end lists', 'new releases', 'random']
-            
-            for href in all_links:
-                # Skip if it's a genre list page (we want individual genre pages)
-                if '/genre/list' in href or '/genre.php' in href:
-                    continue
-                
-                # Extract genre slug to check if it looks like a genre page
-                match = re.search(r'/genre/\d+-(.+)/', href)
-                if match:
-                    all_genres_links.append(href)
-            
-            self.logger.info(f"Found {len(all_genres_links)} potential genre links (fallback method)")
-        
+
+            genre_links = response.xpath(
+                '//a[re:test(@href, "/genre/\\d+-[^/]+/")'
+                ' and not(contains(@href, "/genre/list"))'
+                ' and not(contains(@href, "/genre.php"))]'
+            )
+
+            self.logger.info(f"Found {len(genre_links)} potential genre links (fallback method)")
+
         # Process the genre links
         genres_processed = set()
-        
-        for href in all_genres_links:
-            # Get the text for this link (try to find the corresponding anchor tag)
-            text = None
-            for link in response.css('a[href="' + href + '"]'):
-                text = link.css('::text').get()
-                if text:
-                    break
-            
-            if not text:
-                # Try to extract text from the href itself
-                match = re.search(r'/genre/\d+-(.+)/', href)
-                if match:
-                    text = match.group(1).replace('-', ' ').title()
-            
-            if not text:
-                continue
-            
-            # Skip "View More" links and non-genre links
-            if text.lower() in ['view more', 'similar artists', 'follow', 'on this day', 'newsworthy', 'user updates', 'site updates', 'privacy policy', 'contact us']:
+
+        for link in genre_links:
+            href = link.attrib.get('href')
+            if not href:
                 continue
-            
+
+            text = link.xpath('normalize-space(.)').get()
+
             # Extract genre slug from URL: /genre/7-rock/ -> "rock"
-            match = re.search(r'/genre/\d+-(.+)/', href)
+            match = GENRE_SLUG_RE.search(href)
             if not match:
                 continue
-            
+
             genre_slug = match.group(1)
+
+            if not text:
+                # Derive a display name from the slug
+                text = genre_slug.replace('-', ' ').title()
+
+            # Skip "View More" links and non-genre links
+            if text.lower() in ['view more', 'similar artists', 'follow', 'on this day', 'newsworthy', 'user updates', 'site updates', 'privacy policy', 'contact us']:
+                continue
+
             genre_name = text.strip()
-            
+
             # Skip if we've already processed this genre
             if genre_slug in genres_processed:
                 continue
@@ -198,18 +219,13 @@ class ProductionSpider(scrapy.Spider):
             
             # If target genre is specified, only process that genre
             if self.target_genre:
-                # Try multiple variations of the genre name
-                target_genre_lower = self.target_genre.lower()
-                genre_slug_lower = genre_slug.lower()
-                genre_name_lower = genre_name.lower()
-                
-                # Check various possible matches - use exact matching to avoid substring issues
+                # Exact matching against the precomputed slug candidates
+                # avoids substring issues and re-deriving variations per link
                 matches = (
-                    genre_slug_lower == target_genre_lower.replace(' ', '-') or
-                    genre_slug_lower == target_genre_lower.replace('-', ' ').replace(' ', '-') or
-                    genre_name_lower == target_genre_lower
+                    genre_slug.lower() in self.target_slugs or
+                    genre_name.lower() == self.target_genre.lower()
                 )
-                
+
                 if not matches:
                     continue
             
@@ -218,7 +234,7 @@ class ProductionSpider(scrapy.Spider):
             # For each year in range, create ratings page URL
             for year in range(self.start_year, self.end_year - 1, -1):  # Go backwards
                 ratings_url = f"/ratings/user-highest-rated/{year}/{genre_slug}/"
-                full_url = response.urljoin(ratings_url)
+                full_url = self.BASE_URL + ratings_url
                 
                 self.logger.info(f"  → Year {year}: {full_url}")
                 
@@ -268,7 +284,7 @@ class ProductionSpider(scrapy.Spider):
         if self.resume_mode:
             filtered_links = []
             for link in album_links:
-                full_url = response.urljoin(link)
+                full_url = self._absolute_url(link)
                 if full_url not in self.scraped_urls:
                     filtered_links.append(link)
                 else:
@@ -288,26 +304,13 @@ class ProductionSpider(scrapy.Spider):
 
         self.logger.info(f"Will scrape {albums_to_scrape} albums from this page")
 
-        for i, album_link in enumerate(album_links[:albums_to_scrape]):
-            full_album_url = response.urljoin(album_link)
-            self.logger.info(f"  [{albums_scraped_this_page + i + 1}/{self.albums_per_year}] Album: {full_album_url}")
-
-            yield scrapy.Request(
-                url=full_album_url,
-                callback=self.parse_album_page,
-                meta={
-                    'genre_name': genre_name,
-                    'genre_slug': genre_slug,
-                    'year': year,
-                    'album_number': albums_scraped_this_page + i + 1
-                }
-            )
-
-        # Paginate if we still need more albums
+        # Queue the next ratings page first so discovery keeps running while
+        # the album batch below drains; under CONCURRENT_REQUESTS > 1 the
+        # downloader never idles between listing pages
         total_scraped = albums_scraped_this_page + len(album_links)
         if total_scraped < self.albums_per_year:
             next_page_num = page_num + 1
-            next_url = f"https://www.albumoftheyear.org/ratings/user-highest-rated/{year}/{genre_slug}/{next_page_num}/"
+            next_url = f"{self.BASE_URL}/ratings/user-highest-rated/{year}/{genre_slug}/{next_page_num}/"
             self.logger.info(f"Need more albums ({total_scraped}/{self.albums_per_year}), fetching page {next_page_num}: {next_url}")
 
             yield scrapy.Request(
@@ -321,6 +324,25 @@ class ProductionSpider(scrapy.Spider):
                     'page_num': next_page_num
                 }
             )
+
+        # Emit the whole album batch in one burst
+        album_urls = [self._absolute_url(link) for link in album_links[:albums_to_scrape]]
+        for i, full_album_url in enumerate(album_urls):
+            self.logger.info(f"  [{albums_scraped_this_page + i + 1}/{self.albums_per_year}] Album: {full_album_url}")
+
+        yield from (
+            scrapy.Request(
+                url=full_album_url,
+                callback=self.parse_album_page,
+                meta={
+                    'genre_name': genre_name,
+                    'genre_slug': genre_slug,
+                    'year': year,
+                    'album_number': albums_scraped_this_page + i + 1
+                }
+            )
+            for i, full_album_url in enumerate(album_urls)
+        )
     
     def parse_album_page(self, response):
         """Parse album page using comprehensive extraction"""
@@ -334,43 +356,53 @@ class ProductionSpider(scrapy.Spider):
         # Create album item
         album = AlbumItem()
         album['url'] = response.url
-        album['scraped_at'] = datetime.utcnow()
+        album['scraped_at'] = self.crawl_started_at
         
         # Extract AOTY ID from URL
         album['aoty_id'] = self._extract_aoty_id(response.url)
-        
+
+        # Collect all <head> meta tags once for the meta-based fallbacks
+        meta_tags = self._collect_meta_tags(response)
+
+        # Locate the known container subtrees once; the detail/score
+        # extractions below query these small fragments instead of
+        # re-walking the whole document per field
+        detail_rows = response.css('.detailRow')
+        critic_box = response.css('.albumCriticScoreBox')
+        user_box = response.css('.albumUserScoreBox')
+
         # 1. Extract Album Title
-        album['title'] = self._extract_album_title(response)
-        
+        album['title'] = self._extract_album_title(response, meta_tags)
+
         # 2. Extract Artist Name
-        album['artist_name'] = self._extract_artist_name(response)
-        
+        album['artist_name'] = self._extract_artist_name(response, meta_tags)
+
         # 3. Extract Release Date
-        album['release_date'] = self._extract_release_date(response)
-        
+        album['release_date'] = self._extract_release_date(detail_rows)
+
         # 4. Extract Critic Score
         album['critic_score'] = self._extract_critic_score(response)
-        
+
         # 5. Extract User Score
         album['user_score'] = self._extract_user_score(response)
-        
+
         # 6. Extract Critic Review Count
-        album['critic_review_count'] = self._extract_critic_review_count(response)
-        
+        album['critic_review_count'] = self._extract_critic_review_count(critic_box, meta_tags)
+
         # 7. Extract User Review Count
-        album['user_review_count'] = self._extract_user_review_count(response)
-        
+        album['user_review_count'] = self._extract_user_review_count(user_box)
+
         # 8. Extract Genres
-        album['genres'] = self._extract_genres(response)
-        
+        album['genres'] = self._extract_genres(detail_rows, meta_tags)
+
         # 9. Extract Genre Tags (secondary genres)
-        album['genre_tags'] = self._extract_genre_tags(response)
-        
+        album['genre_tags'] = self._extract_genre_tags(detail_rows)
+
         # 10. Extract Cover Image URL
-        album['cover_image_url'] = self._extract_cover_image(response)
-        
+        album['cover_image_url'] = self._extract_cover_image(response, meta_tags)
+
         # 11. Extract Description
-        album['description'] = self._extract_description(response)
+        album['description'] = self._extract_description(meta_tags)
         
         # Add metadata
         album['scrape_genre'] = genre_name
@@ -389,77 +421,106 @@ class ProductionSpider(scrapy.Spider):
         
         yield album
     
+    def _absolute_url(self, href):
+        """Make a scraped href absolute without re-parsing the base URL"""
+        return href if href.startswith('http') else self.BASE_URL + href
+
     # ===== EXTRACTION METHODS (reused from comprehensive_album_spider) =====
-    
-    def _extract_aoty_id(self, url):
+
+    @staticmethod
+    def _extract_aoty_id(url):
         """Extract AOTY ID from URL"""
-        match = re.search(r'/album/(\d+-[^/]+)\.php', url)
+        match = ALBUM_ID_RE.search(url)
         if match:
             return match.group(1)
         return None
     
-    def _extract_album_title(self, response):
+    @staticmethod
+    def _collect_meta_tags(response):
+        """Collect all <head> meta tags into a dict in one bounded traversal
+
+        The meta-based fallbacks (og:title, og:image, Description, reviewCount,
+        genre, ...) would otherwise each walk the full DOM even though every
+        <meta> tag lives under <head>. itemprop="genre" can appear multiple
+        times, so it accumulates a list.
+        """
+        meta_tags = {}
+        head = response.selector.root.find('head')
+        if head is None:
+            return meta_tags
+
+        for tag in head.iterfind('meta'):
+            key = tag.get('property') or tag.get('name') or tag.get('itemprop')
+            content = tag.get('content')
+            if not key or content is None:
+                continue
+            if key == 'genre':
+                meta_tags.setdefault('genre', []).append(content)
+            elif key not in meta_tags:
+                meta_tags[key] = content
+
+        return meta_tags
+
+    @staticmethod
+    def _extract_album_title(response, meta_tags):
         """Extract album title"""
-        selectors = [
-            'h1.albumTitle span[itemprop="name"]::text',
-            'meta[property="og:title"]::attr(content)',
-            'h1::text',
-        ]
-        
-        for selector in selectors:
-            title = response.css(selector).get()
-            if title:
-                if ' - ' in title:
-                    title = title.split(' - ', 1)[1].strip()
-                return title.strip()
-        
+        title = response.css('h1.albumTitle span[itemprop="name"]::text').get()
+        if not title:
+            title = meta_tags.get('og:title')
+        if not title:
+            title = response.css('h1::text').get()
+
+        if title:
+            if ' - ' in title:
+                title = title.split(' - ', 1)[1].strip()
+            return title.strip()
+
         return None
-    
-    def _extract_artist_name(self, response):
+
+    @staticmethod
+    def _extract_artist_name(response, meta_tags):
         """Extract artist name"""
-        selectors = [
-            '[itemprop="byArtist"] span[itemprop="name"] a::text',
-            '.artist a::text',
-            'meta[property="og:title"]::attr(content)',
-        ]
-        
-        for selector in selectors:
-            artist = response.css(selector).get()
-            if artist:
-                if ' - ' in artist:
-                    artist = artist.split(' - ', 1)[0].strip()
-                if artist.lower() not in ['discography', 'submit correction']:
-                    return artist.strip()
-        
+        artist = response.css('[itemprop="byArtist"] span[itemprop="name"] a::text').get()
+        if not artist:
+            artist = response.css('.artist a::text').get()
+        if not artist:
+            artist = meta_tags.get('og:title')
+
+        if artist:
+            if ' - ' in artist:
+                artist = artist.split(' - ', 1)[0].strip()
+            if artist.lower() not in ['discography', 'submit correction']:
+                return artist.strip()
+
         return None
     
-    def _extract_release_date(self, response):
+    @staticmethod
+    def _extract_release_date(detail_rows):
         """Extract release date"""
-        # Try to find release date in detail rows
-        detail_rows = response.css('.detailRow')
+        # Try to find release date in detail rows; test the row text via
+        # lxml's text_content() and serialize only the row that matches
         for row in detail_rows:
-            row_text = ' '.join(row.css('::text').getall())
-            if 'Release Date' in row_text:
-                # Extract date from this row
-                date_match = re.search(r'>([A-Za-z]+)\s+(\d+),\s+(\d{4})<', row.get())
+            if 'Release Date' in row.root.text_content():
+                date_match = DATE_RE.search(row.get())
                 if date_match:
                     month, day, year = date_match.groups()
                     return f"{month} {day}, {year}"
         
         # Fallback: try to extract from release links
-        date_parts = response.css('.detailRow a[href*="/releases/"]::text').getall()
+        date_parts = detail_rows.css('a[href*="/releases/"]::text').getall()
         if len(date_parts) >= 2:
             month = date_parts[0]
             year = date_parts[1].strip()
             # Try to find day from any detail row
-            detail_text = ' '.join(response.css('.detailRow::text').getall())
+            detail_text = ' '.join(detail_rows.css('::text').getall())
             day_match = re.search(r'(\d+),', detail_text)
             day = day_match.group(1) if day_match else "1"
             return f"{month} {day}, {year}"
         
         return None
     
-    def _extract_critic_score(self, response):
+    @staticmethod
+    def _extract_critic_score(response):
         """Extract critic score"""
         score = response.css('[itemprop="ratingValue"] a::text').get()
         if score:
@@ -469,7 +530,8 @@ class ProductionSpider(scrapy.Spider):
                 return None
         return None
     
-    def _extract_user_score(self, response):
+    @staticmethod
+    def _extract_user_score(response):
         """Extract user score"""
         score = response.css('.albumUserScore a::text').get()
         if score:
@@ -478,33 +540,39 @@ class ProductionSpider(scrapy.Spider):
             except ValueError:
                 return None
         
-        ratings = response.css('.rating::text').getall()
-        for rating in ratings:
-            if rating.strip() and rating.strip() != 'NR':
-                try:
-                    return float(rating.strip())
-                except ValueError:
-                    continue
-        
+        # First non-empty, non-'NR' .rating text, selected lazily in XPath so
+        # lxml stops at the first match instead of materializing every
+        # .rating text on the page
+        rating = response.xpath(
+            '(//*[contains(@class, "rating")]/text()'
+            '[normalize-space(.) and normalize-space(.) != "NR"])[1]'
+        ).get()
+        if rating:
+            try:
+                return float(rating.strip())
+            except ValueError:
+                pass
+
         return None
     
-    def _extract_critic_review_count(self, response):
+    @staticmethod
+    def _extract_critic_review_count(critic_box, meta_tags):
         """Extract critic review count"""
-        count = response.css('meta[itemprop="reviewCount"]::attr(content)').get()
+        count = meta_tags.get('reviewCount')
         if count:
             try:
                 return int(count)
             except ValueError:
                 pass
-        
-        count = response.css('span[itemprop="ratingCount"]::text').get()
+
+        count = critic_box.css('span[itemprop="ratingCount"]::text').get()
         if count:
             try:
                 return int(count)
             except ValueError:
                 pass
-        
-        text = response.css('.albumCriticScoreBox .numReviews::text').get()
+
+        text = critic_box.css('.numReviews::text').get()
         if text:
             match = re.search(r'(\d+)', text)
             if match:
@@ -515,10 +583,11 @@ class ProductionSpider(scrapy.Spider):
         
         return None
     
-    def _extract_user_review_count(self, response):
+    @staticmethod
+    def _extract_user_review_count(user_box):
         """Extract user review count"""
         # Method 1: Look for strong tag inside numReviews
-        text = response.css('.albumUserScoreBox .numReviews strong::text').get()
+        text = user_box.css('.numReviews strong::text').get()
         if text:
             try:
                 # Remove commas before converting (handles "1,234" → 1234)
@@ -527,8 +596,11 @@ class ProductionSpider(scrapy.Spider):
             except ValueError:
                 pass
         
-        # Method 2: Look for link text with numbers
-        link_text = response.css('.albumUserScoreBox .numReviews a::text').get()
+        # Method 2: Look for link text with numbers, matched in XPath via the
+        # EXSLT re: namespace (parsel registers it by default)
+        link_text = user_box.xpath(
+            '(.//*[contains(@class, "numReviews")]//a/text()[re:test(., "\\d")])[1]'
+        ).get()
         if link_text:
             # Match numbers with optional commas: "2,341" or "2341"
             match = re.search(r'([\d,]+)', link_text)
@@ -543,17 +615,19 @@ class ProductionSpider(scrapy.Spider):
         # If both methods fail, return None
         return None
     
-    def _extract_genres(self, response):
+    @staticmethod
+    def _extract_genres(detail_rows, meta_tags):
         """Extract primary genres"""
         genres = []
-        
-        meta_genres = response.css('meta[itemprop="genre"]::attr(content)').getall()
-        genres.extend(meta_genres)
-        
-        genre_links = response.css('.detailRow a[href*="/genre/"]::text').getall()
+
+        # Intern genre names: the same handful of strings recur across
+        # thousands of album pages, so each distinct genre lives once
+        genres.extend(sys.intern(g) for g in meta_tags.get('genre', []))
+
+        genre_links = detail_rows.css('a[href*="/genre/"]::text').getall()
         for genre in genre_links:
             if genre and genre not in genres:
-                genres.append(genre.strip())
+                genres.append(sys.intern(genre.strip()))
         
         seen = set()
         unique_genres = []
@@ -564,39 +638,29 @@ class ProductionSpider(scrapy.Spider):
         
         return unique_genres if unique_genres else None
     
-    def _extract_genre_tags(self, response):
+    @staticmethod
+    def _extract_genre_tags(detail_rows):
         """Extract secondary genre tags"""
-        tags = response.css('.detailRow .secondary::text').getall()
+        tags = detail_rows.css('.secondary::text').getall()
         if tags:
-            return [tag.strip() for tag in tags if tag.strip()]
+            return [sys.intern(tag.strip()) for tag in tags if tag.strip()]
         return None
     
-    def _extract_cover_image(self, response):
+    @staticmethod
+    def _extract_cover_image(response, meta_tags):
         """Extract cover image URL"""
-        selectors = [
-            '.albumTopBox.cover img::attr(src)',
-            'meta[property="og:image"]::attr(content)',
-            'img[alt*=" - "]::attr(src)',
-        ]
-        
-        for selector in selectors:
-            image = response.css(selector).get()
-            if image:
-                return image
-        
-        return None
-    
-    def _extract_description(self, response):
+        image = response.css('.albumTopBox.cover img::attr(src)').get()
+        if not image:
+            image = meta_tags.get('og:image')
+        if not image:
+            image = response.css('img[alt*=" - "]::attr(src)').get()
+
+        return image or None
+
+    @staticmethod
+    def _extract_description(meta_tags):
         """Extract album description"""
-        desc = response.css('meta[name="Description"]::attr(content)').get()
-        if desc:
-            return desc
-        
-        desc = response.css('meta[property="og:description"]::attr(content)').get()
-        if desc:
-            return desc
-        
-        return None
+        return meta_tags.get('Description') or meta_tags.get('og:description') or None
     
     def closed(self, reason):
         """Log final statistics when spider closes"""
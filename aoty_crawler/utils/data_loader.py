@@ -6,50 +6,114 @@ Loads album data from JSON/CSV files in data/output/
 
 import json
 import csv
+import hashlib
+import operator
 import os
-import glob
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import reduce
+
+import numpy as np
+
+# Optional streaming JSON parser - keeps peak memory at one album instead
+# of a whole albums_*.json file
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional native JSON parser for the non-streaming paths (whole-file
+# fallback and the per-row genre cells in CSV files)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Values that mean "no data" in scraped files; one frozenset lookup
+# replaces the old four-way string-compare chain per field
+_NULLISH = frozenset(('', 'null', 'None', None))
+
+# (field, default-when-missing-or-unparseable) coercion tables
+_FLOAT_FIELDS = (('critic_score', None), ('user_score', None))
+_INT_FIELDS = (('critic_review_count', 0), ('user_review_count', 0), ('scrape_year', None))
+
+# Coercion guarantees the review counts exist as ints (0 when missing),
+# so the filter predicates can read them with itemgetter instead of
+# .get() plus an or-0 branch per album
+_get_critic_reviews = operator.itemgetter('critic_review_count')
+_get_user_reviews = operator.itemgetter('user_review_count')
+
+
+def _coerce_album(album):
+    """Clean and convert numeric fields of a single album in place"""
+    for field, default in _FLOAT_FIELDS:
+        value = album.get(field)
+        if value in _NULLISH:
+            album[field] = default
+        else:
+            try:
+                album[field] = float(value)
+            except (ValueError, TypeError):
+                album[field] = default
+
+    for field, default in _INT_FIELDS:
+        value = album.get(field)
+        if value in _NULLISH:
+            album[field] = default
+        else:
+            try:
+                album[field] = int(float(value))  # Handle float strings like 2.0
+            except (ValueError, TypeError):
+                album[field] = default
+
+    return album
 
 
 def load_albums_from_json(json_file_path):
-    """Load albums from a single JSON file"""
+    """Stream albums from a single JSON file, one album at a time"""
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            albums = json.load(f)
-        
-        # Ensure we have a list
-        if isinstance(albums, dict):
-            albums = [albums]
-        
-        # Clean and convert types for each album
-        for album in albums:
-            # Convert numeric fields from strings to appropriate types
-            for field in ['critic_score', 'user_score']:
-                value = album.get(field)
-                if value is not None and value != '' and value != 'null' and value != 'None':
-                    try:
-                        album[field] = float(value)
-                    except (ValueError, TypeError):
-                        album[field] = None
-                else:
-                    album[field] = None
-            
-            for field in ['critic_review_count', 'user_review_count', 'scrape_year']:
-                value = album.get(field)
-                if value is not None and value != '' and value != 'null' and value != 'None':
-                    try:
-                        album[field] = int(float(value))  # Handle float strings like 2.0
-                    except (ValueError, TypeError):
-                        album[field] = 0
-                else:
-                    album[field] = 0 if field != 'scrape_year' else None
-        
-        print(f"✅ Loaded {len(albums)} albums from {json_file_path}")
-        return albums
-        
+        count = 0
+        with open(json_file_path, 'rb') as f:
+            # Peek at the first non-whitespace byte: top-level arrays are
+            # streamed item by item, anything else (single-album dict)
+            # falls back to a plain json.load
+            first = f.read(1)
+            while first and first.isspace():
+                first = f.read(1)
+            f.seek(0)
+
+            if ijson is not None and first == b'[':
+                for album in ijson.items(f, 'item'):
+                    count += 1
+                    yield _coerce_album(album)
+            else:
+                albums = _json_loads(f.read())
+
+                # Ensure we have a list
+                if isinstance(albums, dict):
+                    albums = [albums]
+
+                for album in albums:
+                    count += 1
+                    yield _coerce_album(album)
+
+        print(f"✅ Loaded {count} albums from {json_file_path}")
+
     except Exception as e:
         print(f"❌ Error loading JSON file {json_file_path}: {e}")
-        return []
+
+
+# CSV columns the rest of the pipeline actually consumes
+_CSV_COLUMNS = (
+    'aoty_id', 'url', 'title', 'artist_name', 'release_date',
+    'critic_score', 'user_score', 'critic_review_count', 'user_review_count',
+    'genres', 'genre_tags', 'cover_image_url', 'description',
+    'scraped_at', 'scrape_year',
+)
 
 
 def load_albums_from_csv(csv_file_path):
@@ -57,101 +121,201 @@ def load_albums_from_csv(csv_file_path):
     try:
         albums = []
         with open(csv_file_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
+            # Resolve column indices from the header once and build narrow
+            # dicts per row; DictReader re-maps every column name on every
+            # row including ones nothing downstream reads
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                print(f"✅ Loaded 0 albums from {csv_file_path}")
+                return []
+
+            index = {name: i for i, name in enumerate(header)}
+            columns = [(name, index[name]) for name in _CSV_COLUMNS if name in index]
+
             for row in reader:
-                # Convert numeric fields
-                album = dict(row)
-                
                 # Clean and convert numeric fields
-                for field in ['critic_score', 'user_score']:
-                    value = album.get(field)
-                    if value is not None and value != '' and value != 'null' and value != 'None':
-                        try:
-                            album[field] = float(value)
-                        except (ValueError, TypeError):
-                            album[field] = None
-                    else:
-                        album[field] = None
-                
-                for field in ['critic_review_count', 'user_review_count', 'scrape_year']:
-                    value = album.get(field)
-                    if value is not None and value != '' and value != 'null' and value != 'None':
-                        try:
-                            album[field] = int(float(value))
-                        except (ValueError, TypeError):
-                            album[field] = 0 if field != 'scrape_year' else None
-                    else:
-                        album[field] = 0 if field != 'scrape_year' else None
-                
+                album = _coerce_album({name: row[i] for name, i in columns})
+
                 # Parse genres from JSON string if needed
                 for field in ['genres', 'genre_tags']:
                     if field in album and album[field]:
                         try:
-                            album[field] = json.loads(album[field])
-                        except json.JSONDecodeError:
+                            album[field] = _json_loads(album[field])
+                        except ValueError:
                             album[field] = [album[field]] if album[field] else []
-                
+
                 albums.append(album)
-        
+
         print(f"✅ Loaded {len(albums)} albums from {csv_file_path}")
         return albums
-        
+
     except Exception as e:
         print(f"❌ Error loading CSV file {csv_file_path}: {e}")
         return []
 
 
+def _cache_key(file_stats):
+    """Hash of (path, mtime, size) tuples for every input file"""
+    h = hashlib.sha1()
+    for path, mtime_ns, size in sorted(file_stats):
+        h.update(f'{path}|{mtime_ns}|{size}'.encode())
+    return h.hexdigest()[:16]
+
+
+def _scan_album_files(output_dir):
+    """Find albums_*.json / albums_*.csv files in one scandir pass
+
+    Returns sorted JSON and CSV path lists plus (path, mtime_ns, size)
+    tuples taken from the cached DirEntry stat, so callers can key the
+    snapshot cache without a second stat call per file.
+    """
+    json_files = []
+    csv_files = []
+    file_stats = []
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.startswith('albums_'):
+                continue
+            if name.endswith('.json'):
+                json_files.append(entry.path)
+            elif name.endswith('.csv'):
+                csv_files.append(entry.path)
+            else:
+                continue
+            st = entry.stat()
+            file_stats.append((entry.path, st.st_mtime_ns, st.st_size))
+    json_files.sort()
+    csv_files.sort()
+    return json_files, csv_files, file_stats
+
+
+def _load_json_file(json_file_path):
+    """Load one JSON file into a list (module-level so workers can pickle it)"""
+    return list(load_albums_from_json(json_file_path))
+
+
+def _iter_album_batches(json_files, csv_files):
+    """Yield one list of albums per input file
+
+    JSON parsing and coercion are CPU-bound and independent per file, so
+    with more than one JSON file the files are parsed in worker processes;
+    a single file (the common case) stays in-process to skip the pool
+    startup cost.
+    """
+    if len(json_files) > 1:
+        with ProcessPoolExecutor() as executor:
+            yield from executor.map(_load_json_file, json_files, chunksize=4)
+    elif json_files:
+        yield _load_json_file(json_files[0])
+
+    for csv_file in csv_files:
+        yield load_albums_from_csv(csv_file)
+
+
 def load_all_albums(output_dir='data/output', deduplicate=True):
     """Load all albums from all JSON/CSV files in the output directory"""
-    all_albums = []
-    
     # Ensure directory exists
     if not os.path.exists(output_dir):
         print(f"❌ Output directory not found: {output_dir}")
         return []
-    
-    # Find all JSON files
-    json_files = glob.glob(os.path.join(output_dir, 'albums_*.json'))
-    
-    # Find all CSV files
-    csv_files = glob.glob(os.path.join(output_dir, 'albums_*.csv'))
-    
+
+    # Find all JSON and CSV files in one directory pass
+    json_files, csv_files, file_stats = _scan_album_files(output_dir)
+
     print(f"🔍 Found {len(json_files)} JSON files and {len(csv_files)} CSV files in {output_dir}")
-    
-    # Load from JSON files
-    for json_file in sorted(json_files):
-        albums = load_albums_from_json(json_file)
-        all_albums.extend(albums)
-    
-    # Load from CSV files (if any)
-    for csv_file in sorted(csv_files):
-        albums = load_albums_from_csv(csv_file)
-        all_albums.extend(albums)
-    
-    # Remove duplicates based on aoty_id (if enabled)
-    if deduplicate:
-        unique_albums = {}
-        for album in all_albums:
-            aoty_id = album.get('aoty_id')
-            # Only add if we have a valid aoty_id and title
-            if aoty_id and aoty_id != 'album' and album.get('title'):
-                unique_albums[aoty_id] = album
-        
-        unique_albums_list = list(unique_albums.values())
-        duplicates_removed = len(all_albums) - len(unique_albums_list)
-        
-        if duplicates_removed > 0:
-            print(f"🗑️  Removed {duplicates_removed} duplicate/invalid entries")
-    else:
-        unique_albums_list = all_albums
-    
-    # Filter out invalid/placeholder albums
-    valid_albums = filter_invalid_albums(unique_albums_list)
-    
+
+    # Output files only change when a crawl runs, so the coerced and
+    # deduplicated result is snapshotted to disk keyed by the input
+    # files' (path, mtime, size) and reused until they change
+    cache_path = None
+    if deduplicate and (json_files or csv_files):
+        key = _cache_key(file_stats)
+        cache_path = os.path.join(output_dir, f'.albums_cache_{key}.pkl')
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    valid_albums = pickle.load(f)
+                print(f"📦 Loaded {len(valid_albums)} albums from snapshot cache")
+                return valid_albums
+            except Exception:
+                pass  # Corrupt/unreadable snapshot - fall through to a full reload
+
+    # Validate and deduplicate each album as it streams in, instead of
+    # building the full list and then rebuilding it twice more - one pass
+    # over the data instead of three
+    valid_albums = []
+    seen_ids = set()
+    skipped = 0
+
+    for albums in _iter_album_batches(json_files, csv_files):
+        for album in albums:
+            if not _is_valid_album(album):
+                skipped += 1
+                continue
+
+            if deduplicate:
+                aoty_id = album.get('aoty_id')
+                if not aoty_id or aoty_id == 'album' or aoty_id in seen_ids:
+                    skipped += 1
+                    continue
+                seen_ids.add(aoty_id)
+
+            valid_albums.append(album)
+
+    if skipped > 0:
+        print(f"🗑️  Removed {skipped} duplicate/invalid entries")
+
+    if cache_path is not None:
+        try:
+            # Drop snapshots for older input states, then persist this one
+            with os.scandir(output_dir) as it:
+                for entry in it:
+                    if entry.name.startswith('.albums_cache_') and entry.name.endswith('.pkl'):
+                        os.remove(entry.path)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(valid_albums, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass  # The snapshot is best-effort; loading still succeeded
+
     print(f"📊 Total valid albums loaded: {len(valid_albums)}")
     return valid_albums
 
 
+def iter_albums(output_dir='data/output', deduplicate=True):
+    """Stream valid albums from all output files one at a time
+
+    Generator counterpart to load_all_albums for consumers that stop
+    early (e.g. search with a small limit): files are read lazily, no
+    full list is materialized and the snapshot cache is not touched.
+    """
+    if not os.path.exists(output_dir):
+        print(f"❌ Output directory not found: {output_dir}")
+        return
+
+    json_files, csv_files, _ = _scan_album_files(output_dir)
+
+    seen_ids = set()
+    for file_path in json_files + csv_files:
+        if file_path.endswith('.json'):
+            albums = load_albums_from_json(file_path)
+        else:
+            albums = load_albums_from_csv(file_path)
+
+        for album in albums:
+            if not _is_valid_album(album):
+                continue
+
+            if deduplicate:
+                aoty_id = album.get('aoty_id')
+                if not aoty_id or aoty_id == 'album' or aoty_id in seen_ids:
+                    continue
+                seen_ids.add(aoty_id)
+
+            yield album
+
+
 def load_latest_albums(output_dir='data/output', limit=1, deduplicate=True):
     """Load albums from the most recent JSON/CSV files"""
     all_albums = []
@@ -161,13 +325,19 @@ def load_latest_albums(output_dir='data/output', limit=1, deduplicate=True):
         print(f"❌ Output directory not found: {output_dir}")
         return []
     
-    # Find all JSON files and sort by modification time
-    json_files = sorted(glob.glob(os.path.join(output_dir, 'albums_*.json')), 
-                       key=lambda x: os.path.getmtime(x), reverse=True)
-    
-    # Find all CSV files and sort by modification time
-    csv_files = sorted(glob.glob(os.path.join(output_dir, 'albums_*.csv')), 
-                      key=lambda x: os.path.getmtime(x), reverse=True)
+    # Find all JSON/CSV files and sort by modification time. A single
+    # scandir pass with the cached DirEntry stat replaces glob plus a
+    # second stat per file in the sort key.
+    with os.scandir(output_dir) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in it
+            if entry.name.startswith('albums_') and entry.name.endswith(('.json', '.csv'))
+        ]
+    entries.sort(reverse=True)
+
+    json_files = [path for _, path in entries if path.endswith('.json')]
+    csv_files = [path for _, path in entries if path.endswith('.csv')]
     
     # Load from latest files (up to limit of each type)
     for json_file in json_files[:limit]:
@@ -186,19 +356,109 @@ def load_latest_albums(output_dir='data/output', limit=1, deduplicate=True):
             # Only add if we have a valid aoty_id and title
             if aoty_id and aoty_id != 'album' and album.get('title'):
                 unique_albums[aoty_id] = album
-        
+
         unique_albums_list = list(unique_albums.values())
         duplicates_removed = len(all_albums) - len(unique_albums_list)
-        
+
         if duplicates_removed > 0:
             print(f"🗑️  Removed {duplicates_removed} duplicate/invalid entries")
     else:
         unique_albums_list = all_albums
-    
+
     print(f"📊 Loaded {len(unique_albums_list)} unique albums from latest files")
     return unique_albums_list
 
 
+def _genre_set(album):
+    """Return the album's lowercased genres as a frozenset, cached on the dict
+
+    Genre filters used to re-lowercase every album genre for every filter
+    genre on every call; the frozenset is built once per album and reused
+    across filter calls.
+    """
+    genres_lc = album.get('_genres_lc')
+    if genres_lc is None:
+        genres_lc = frozenset(g.lower() for g in album.get('genres') or ())
+        album['_genres_lc'] = genres_lc
+    return genres_lc
+
+
+def _haystack(album):
+    """Return a lowercased title/artist/description blob, cached on the dict
+
+    One C-level substring scan per album instead of three per-call
+    str.lower() + `in` scans; \\x1f separators keep matches from spanning
+    field boundaries.
+    """
+    haystack = album.get('_haystack')
+    if haystack is None:
+        haystack = '\x1f'.join((
+            album.get('title') or '',
+            album.get('artist_name') or '',
+            album.get('description') or '',
+        )).lower()
+        album['_haystack'] = haystack
+    return haystack
+
+
+# Compiled predicates keyed by the criteria that produced them; repeated
+# interactive filtering with the same criteria reuses the function
+_PRED_CACHE = {}
+
+
+def _compile_predicate(conds, env, kwargs):
+    """Compile the active filter conditions into one straight-line function
+
+    One generated function with the criteria values baked in replaces a
+    per-album loop over a list of predicate lambdas: a single call and a
+    chain of compares instead of predicate dispatch per criterion. The
+    cache key is the repr of the criteria, so identical values always map
+    to the same compiled function.
+    """
+    key = tuple(sorted((k, repr(v)) for k, v in kwargs.items() if v is not None))
+    predicate = _PRED_CACHE.get(key)
+    if predicate is None:
+        source = 'def _pred(a):\n    return (' + '\n        and '.join(
+            f'({cond})' for cond in conds) + ')'
+        namespace = {
+            '_haystack': _haystack,
+            '_genre_set': _genre_set,
+            '_get_critic_reviews': _get_critic_reviews,
+            '_get_user_reviews': _get_user_reviews,
+        }
+        namespace.update(env)
+        exec(source, namespace)
+        predicate = _PRED_CACHE[key] = namespace['_pred']
+    return predicate
+
+
+# Inverted index caches: lowercased genre -> positions, one per album
+# list, so repeated genre searches intersect posting lists instead of
+# rescanning every album
+_GENRE_INDEX_CACHE = {}
+
+
+def _genre_index(albums):
+    """Return (building if needed) the genre posting lists for this list"""
+    key = id(albums)
+    cached = _GENRE_INDEX_CACHE.get(key)
+    if cached is not None:
+        length, first_id, index = cached
+        # Guard against a different list reusing the same id
+        if length == len(albums) and (not albums or first_id == id(albums[0])):
+            return index
+
+    postings = {}
+    for pos, album in enumerate(albums):
+        for genre in album.get('genres') or ():
+            postings.setdefault(genre.lower(), []).append(pos)
+
+    index = {genre: np.asarray(positions, dtype=np.int32)
+             for genre, positions in postings.items()}
+    _GENRE_INDEX_CACHE[key] = (len(albums), id(albums[0]) if albums else None, index)
+    return index
+
+
 def filter_albums(albums, **kwargs):
     """
     Filter albums based on criteria
@@ -225,141 +485,221 @@ def filter_albums(albums, **kwargs):
     """
     if not albums:
         return []
-    
-    filtered = albums[:]
-    
-    # Filter by genres (any match)
-    if 'genres' in kwargs and kwargs['genres']:
-        # Convert album genres to lowercase set for comparison
-        filtered = [a for a in filtered if any(
-            g.lower() in [ag.lower() for ag in a.get('genres', [])]
-            for g in kwargs['genres']
-        )]
-        print(f"🔍 Filtered by genres: {kwargs['genres']} → {len(filtered)} albums")
-    
-    # Filter by genres (all must match)
-    if 'genres_all' in kwargs and kwargs['genres_all']:
-        # Check if ALL filter genres are in the album's genres
-        filtered = [a for a in filtered if all(
-            g.lower() in [ag.lower() for ag in a.get('genres', [])]
-            for g in kwargs['genres_all']
-        )]
-        print(f"🔍 Filtered by all genres: {kwargs['genres_all']} → {len(filtered)} albums")
-    
-    # Filter by critic score
-    if 'min_score' in kwargs and kwargs['min_score'] is not None:
-        filtered = [a for a in filtered if a.get('critic_score') is not None and a.get('critic_score') >= kwargs['min_score']]
-        print(f"🔍 Filtered by min critic score ≥ {kwargs['min_score']} → {len(filtered)} albums")
-    
-    if 'max_score' in kwargs and kwargs['max_score'] is not None:
-        filtered = [a for a in filtered if a.get('critic_score') is not None and a.get('critic_score') <= kwargs['max_score']]
-        print(f"🔍 Filtered by max critic score ≤ {kwargs['max_score']} → {len(filtered)} albums")
-    
-    # Filter by user score
-    if 'min_user_score' in kwargs and kwargs['min_user_score'] is not None:
-        filtered = [a for a in filtered if a.get('user_score') is not None and a.get('user_score') >= kwargs['min_user_score']]
-        print(f"🔍 Filtered by min user score ≥ {kwargs['min_user_score']} → {len(filtered)} albums")
-    
-    if 'max_user_score' in kwargs and kwargs['max_user_score'] is not None:
-        filtered = [a for a in filtered if a.get('user_score') is not None and a.get('user_score') <= kwargs['max_user_score']]
-        print(f"🔍 Filtered by max user score ≤ {kwargs['max_user_score']} → {len(filtered)} albums")
-    
-    # Filter by review count
-    if 'min_reviews' in kwargs and kwargs['min_reviews'] is not None:
-        filtered = [a for a in filtered if (a.get('critic_review_count') or 0) + (a.get('user_review_count') or 0) >= kwargs['min_reviews']]
-        print(f"🔍 Filtered by min reviews ≥ {kwargs['min_reviews']} → {len(filtered)} albums")
-    
-    if 'min_user_reviews' in kwargs and kwargs['min_user_reviews'] is not None:
-        filtered = [a for a in filtered if (a.get('user_review_count') or 0) >= kwargs['min_user_reviews']]
-        print(f"🔍 Filtered by min user reviews ≥ {kwargs['min_user_reviews']} → {len(filtered)} albums")
-    
-    if 'min_critic_reviews' in kwargs and kwargs['min_critic_reviews'] is not None:
-        filtered = [a for a in filtered if (a.get('critic_review_count') or 0) >= kwargs['min_critic_reviews']]
-        print(f"🔍 Filtered by min critic reviews ≥ {kwargs['min_critic_reviews']} → {len(filtered)} albums")
-
-    if 'max_critic_reviews' in kwargs and kwargs['max_critic_reviews'] is not None:
-        filtered = [a for a in filtered if (a.get('critic_review_count') or 0) <= kwargs['max_critic_reviews']]
-        print(f"🔍 Filtered by max critic reviews ≤ {kwargs['max_critic_reviews']} → {len(filtered)} albums")
-
-    if 'max_user_reviews' in kwargs and kwargs['max_user_reviews'] is not None:
-        filtered = [a for a in filtered if (a.get('user_review_count') or 0) <= kwargs['max_user_reviews']]
-        print(f"🔍 Filtered by max user reviews ≤ {kwargs['max_user_reviews']} → {len(filtered)} albums")
-
-    # Filter by year
-    if 'year' in kwargs and kwargs['year'] is not None:
-        filtered = [a for a in filtered if a.get('scrape_year') == kwargs['year']]
-        print(f"🔍 Filtered by year {kwargs['year']} → {len(filtered)} albums")
-    
-    if 'year_min' in kwargs and kwargs['year_min'] is not None:
-        filtered = [a for a in filtered if a.get('scrape_year', 0) >= kwargs['year_min']]
-        print(f"🔍 Filtered by year ≥ {kwargs['year_min']} → {len(filtered)} albums")
-    
-    if 'year_max' in kwargs and kwargs['year_max'] is not None:
-        filtered = [a for a in filtered if a.get('scrape_year', 9999) <= kwargs['year_max']]
-        print(f"🔍 Filtered by year ≤ {kwargs['year_max']} → {len(filtered)} albums")
-    
-    # Filter by search string
-    if 'search' in kwargs and kwargs['search']:
-        search_term = kwargs['search'].lower()
-        filtered = [a for a in filtered if 
-                   search_term in (a.get('title') or '').lower() or
-                   search_term in (a.get('artist_name') or '').lower() or
-                   search_term in (a.get('description') or '').lower()]
-        print(f"🔍 Filtered by search '{kwargs['search']}' → {len(filtered)} albums")
-    
+
+    # Genre criteria resolve through the inverted index: union the
+    # posting lists for any-match, intersect them for all-match, and only
+    # run the remaining predicate over the candidates
+    genres_any = kwargs.pop('genres', None)
+    genres_all = kwargs.pop('genres_all', None)
+
+    candidates = albums
+    applied_genres = []
+    if genres_any or genres_all:
+        index = _genre_index(albums)
+        empty = np.empty(0, dtype=np.int32)
+        positions = None
+
+        if genres_any:
+            positions = reduce(np.union1d,
+                               (index.get(g.lower(), empty) for g in genres_any))
+            applied_genres.append(f"genres: {genres_any}")
+
+        if genres_all:
+            all_positions = reduce(np.intersect1d,
+                                   (index.get(g.lower(), empty) for g in genres_all))
+            positions = all_positions if positions is None else np.intersect1d(positions, all_positions)
+            applied_genres.append(f"all genres: {genres_all}")
+
+        candidates = [albums[i] for i in positions]
+
+    predicate, applied = _build_filter(kwargs)
+    applied = applied_genres + applied
+
+    if predicate is None:
+        if not applied_genres:
+            return albums
+        filtered = candidates
+    else:
+        filtered = list(filter(predicate, candidates))
+
+    print(f"🔍 Filtered by {', '.join(applied)} → {len(filtered)} albums")
     return filtered
 
 
+def iter_filtered_albums(albums, **kwargs):
+    """Lazily yield albums matching the filter_albums criteria
+
+    Generator counterpart for consumers that stop early (e.g. search
+    with a small limit); accepts any iterable and prints no summary.
+    """
+    predicate, _ = _build_filter(kwargs)
+    if predicate is None:
+        yield from albums
+    else:
+        yield from filter(predicate, albums)
+
+
+def _build_filter(kwargs):
+    """Compile filter criteria into (predicate, descriptions)
+
+    Collects one condition per active criterion, roughly most-selective
+    first, and compiles them into one straight-line predicate. Each
+    criterion is read from kwargs exactly once into a local that feeds
+    the condition source, its bound value, and the summary line. Returns
+    (None, []) when no criterion is active.
+    """
+    conds = []
+    env = {}
+    applied = []
+
+    # Search string (usually the most selective filter)
+    search = kwargs.get('search')
+    if search:
+        conds.append('_search in _haystack(a)')
+        env['_search'] = search.lower()
+        applied.append(f"search '{search}'")
+
+    # Critic score
+    min_score = kwargs.get('min_score')
+    if min_score is not None:
+        conds.append("a.get('critic_score') is not None and a['critic_score'] >= _min_score")
+        env['_min_score'] = min_score
+        applied.append(f"min critic score ≥ {min_score}")
+
+    max_score = kwargs.get('max_score')
+    if max_score is not None:
+        conds.append("a.get('critic_score') is not None and a['critic_score'] <= _max_score")
+        env['_max_score'] = max_score
+        applied.append(f"max critic score ≤ {max_score}")
+
+    # User score
+    min_user_score = kwargs.get('min_user_score')
+    if min_user_score is not None:
+        conds.append("a.get('user_score') is not None and a['user_score'] >= _min_user_score")
+        env['_min_user_score'] = min_user_score
+        applied.append(f"min user score ≥ {min_user_score}")
+
+    max_user_score = kwargs.get('max_user_score')
+    if max_user_score is not None:
+        conds.append("a.get('user_score') is not None and a['user_score'] <= _max_user_score")
+        env['_max_user_score'] = max_user_score
+        applied.append(f"max user score ≤ {max_user_score}")
+
+    # Genres (any match / all must match); lowercase the filter genres
+    # once and intersect with the cached per-album genre set
+    genres = kwargs.get('genres')
+    if genres:
+        conds.append('_genre_set(a) & _genres_any')
+        env['_genres_any'] = frozenset(g.lower() for g in genres)
+        applied.append(f"genres: {genres}")
+
+    genres_all = kwargs.get('genres_all')
+    if genres_all:
+        conds.append('_genres_all <= _genre_set(a)')
+        env['_genres_all'] = frozenset(g.lower() for g in genres_all)
+        applied.append(f"all genres: {genres_all}")
+
+    # Review counts
+    min_reviews = kwargs.get('min_reviews')
+    if min_reviews is not None:
+        conds.append('_get_critic_reviews(a) + _get_user_reviews(a) >= _min_reviews')
+        env['_min_reviews'] = min_reviews
+        applied.append(f"min reviews ≥ {min_reviews}")
+
+    min_user_reviews = kwargs.get('min_user_reviews')
+    if min_user_reviews is not None:
+        conds.append('_get_user_reviews(a) >= _min_user_reviews')
+        env['_min_user_reviews'] = min_user_reviews
+        applied.append(f"min user reviews ≥ {min_user_reviews}")
+
+    min_critic_reviews = kwargs.get('min_critic_reviews')
+    if min_critic_reviews is not None:
+        conds.append('_get_critic_reviews(a) >= _min_critic_reviews')
+        env['_min_critic_reviews'] = min_critic_reviews
+        applied.append(f"min critic reviews ≥ {min_critic_reviews}")
+
+    max_critic_reviews = kwargs.get('max_critic_reviews')
+    if max_critic_reviews is not None:
+        conds.append('_get_critic_reviews(a) <= _max_critic_reviews')
+        env['_max_critic_reviews'] = max_critic_reviews
+        applied.append(f"max critic reviews ≤ {max_critic_reviews}")
+
+    max_user_reviews = kwargs.get('max_user_reviews')
+    if max_user_reviews is not None:
+        conds.append('_get_user_reviews(a) <= _max_user_reviews')
+        env['_max_user_reviews'] = max_user_reviews
+        applied.append(f"max user reviews ≤ {max_user_reviews}")
+
+    # Year
+    year = kwargs.get('year')
+    if year is not None:
+        conds.append("a.get('scrape_year') == _year")
+        env['_year'] = year
+        applied.append(f"year {year}")
+
+    year_min = kwargs.get('year_min')
+    if year_min is not None:
+        conds.append("a.get('scrape_year', 0) >= _year_min")
+        env['_year_min'] = year_min
+        applied.append(f"year ≥ {year_min}")
+
+    year_max = kwargs.get('year_max')
+    if year_max is not None:
+        conds.append("a.get('scrape_year', 9999) <= _year_max")
+        env['_year_max'] = year_max
+        applied.append(f"year ≤ {year_max}")
+
+    if not conds:
+        return None, []
+
+    return _compile_predicate(conds, env, kwargs), applied
+
+
+def _is_valid_album(album):
+    """Check a single album for placeholder/invalid data"""
+    artist = (album.get('artist_name') or '').strip()
+    title = (album.get('title') or '').strip()
+
+    # Reject placeholder artist/title entries
+    if artist.lower() in ('submit correction', 'album', 'artist', 'unknown', ''):
+        return False
+
+    if title.lower() in ('discography', 'album', 'artist', 'unknown', ''):
+        return False
+
+    # Reject if no scores and no reviews
+    has_score = album.get('critic_score') is not None or album.get('user_score') is not None
+    has_reviews = (album.get('critic_review_count') or 0) > 0 or (album.get('user_review_count') or 0) > 0
+
+    if not has_score and not has_reviews:
+        return False
+
+    # Reject if genres is empty or None
+    if not album.get('genres'):
+        return False
+
+    return True
+
+
 def filter_invalid_albums(albums):
     """
     Filter out placeholder/invalid albums (e.g., artist='Submit Correction', no scores, no genres)
-    
+
     Args:
         albums: List of album dictionaries
-    
+
     Returns:
         Filtered list of valid albums
     """
     if not albums:
         return []
-    
-    valid_albums = []
-    for album in albums:
-        # Skip placeholder entries
-        artist = (album.get('artist_name') or '').strip()
-        title = (album.get('title') or '').strip()
-        
-        # Skip if artist is placeholder
-        if artist.lower() in ['submit correction', 'album', 'artist', 'unknown', '']:
-            continue
-        
-        # Skip if title is placeholder
-        if title.lower() in ['discography', 'album', 'artist', 'unknown', '']:
-            continue
-        
-        # Skip if no scores and no reviews
-        critic_score = album.get('critic_score')
-        user_score = album.get('user_score')
-        critic_reviews = album.get('critic_review_count')
-        user_reviews = album.get('user_review_count')
-        
-        has_score = critic_score is not None or user_score is not None
-        has_reviews = (critic_reviews or 0) > 0 or (user_reviews or 0) > 0
-        
-        if not has_score and not has_reviews:
-            continue
-        
-        # Skip if genres is empty or None
-        genres = album.get('genres')
-        if not genres or (isinstance(genres, list) and len(genres) == 0):
-            continue
-        
-        valid_albums.append(album)
-    
+
+    valid_albums = [album for album in albums if _is_valid_album(album)]
+
     removed_count = len(albums) - len(valid_albums)
     if removed_count > 0:
         print(f"🗑️  Removed {removed_count} invalid/placeholder albums")
-    
+
     return valid_albums
 
 
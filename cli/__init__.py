@@ -1 +1,3 @@
 # CLI package initialization
+
+__version__ = '1.0.0'
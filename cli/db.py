@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared database access for the CLI commands
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Create the SQLAlchemy engine once per process
+
+    Engine construction sets up the dialect and connection pool; caching
+    it means batch-invoking several commands in one process (tests,
+    embedding) bootstraps the database exactly once.
+    """
+    from database.models import create_database_engine
+    return create_database_engine()
+
+
+@contextmanager
+def session_scope():
+    """Yield a session on the shared engine, always closed on exit"""
+    from database.models import get_session
+    session = get_session(get_engine())
+    try:
+        yield session
+    finally:
+        session.close()
@@ -7,25 +7,11 @@ import argparse
 import sys
 import logging
 import os
-from datetime import datetime
+from functools import lru_cache
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-# Import spiders for crawl command
-from aoty_crawler.spiders import HtmlDebugSpider, GenreTestSpider, ComprehensiveAlbumSpider, ProductionSpider, ProductionTestSpider
-
-
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description='AOTY Crawler - Music Data Collection Tool',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   python -m cli scrape                                          # Start scraping all genres
   python -m cli scrape --genre hip-hop                          # Scrape hip-hop genre
@@ -36,15 +22,52 @@ Examples:
   python -m cli scrape --resume                                 # Resume previous scrape
   python -m cli crawl production                                # Run production spider directly
         """
+
+
+@lru_cache(maxsize=1)
+def _scrapy_settings():
+    """Load Scrapy project settings once per process
+
+    get_project_settings parses settings.py and drags in the
+    scrapy/twisted import chain; caching it means repeated command
+    dispatch in one process pays that cost once.
+    """
+    from scrapy.utils.project import get_project_settings
+    return get_project_settings()
+
+
+@lru_cache(maxsize=1)
+def _spider_map():
+    """Import spider classes once and map CLI spider names to them"""
+    from aoty_crawler.spiders import (
+        AlbumSpider,
+        ArtistSpider,
+        ComprehensiveAlbumSpider,
+        GenreSpider,
+        ProductionSpider,
+        YearSpider,
     )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Crawl command (for running specific spiders)
+    return {
+        'comprehensive_album': ComprehensiveAlbumSpider,
+        'production': ProductionSpider,
+        'album': AlbumSpider,
+        'artist': ArtistSpider,
+        'genre': GenreSpider,
+        'year': YearSpider,
+    }
+
+
+# Per-command subparser builders. main() sniffs the requested subcommand
+# from argv and builds only that parser; the full tree is still built
+# for --help, bare invocations and unknown commands, so help output is
+# unchanged.
+
+def _build_crawl_parser(subparsers):
     crawl_parser = subparsers.add_parser('crawl', help='Run a specific spider')
     crawl_parser.add_argument('spider', help='Name of the spider to run (e.g., test, album, artist)')
-    
-    # Scrape command
+
+
+def _build_scrape_parser(subparsers):
     scrape_parser = subparsers.add_parser('scrape', help='Start scraping albums')
     scrape_parser.add_argument('--genre', '-g', help='Genre to scrape (e.g., rock, hip-hop, electronic)')
     scrape_parser.add_argument('--start-year', type=int, help='Starting year for scraping (default: 2026)')
@@ -55,11 +78,15 @@ Examples:
     scrape_parser.add_argument('--limit', '-l', type=int, default=10, help='Limit number of items (test mode only)')
     scrape_parser.add_argument('--resume', action='store_true', help='Resume from previous scrape')
     scrape_parser.add_argument('--resume-file', help='Specific resume file to load')
-    
-    # List genres command
-    list_genres_parser = subparsers.add_parser('list-genres', help='List available genres')
-    
-    # Search command
+    scrape_parser.add_argument('--selenium-workers', type=int, default=4,
+                               help='Concurrent browser workers for Selenium-based fetching (default: 4)')
+
+
+def _build_list_genres_parser(subparsers):
+    subparsers.add_parser('list-genres', help='List available genres')
+
+
+def _build_search_parser(subparsers):
     search_parser = subparsers.add_parser('search', help='Search albums')
     search_parser.add_argument('--genres', help='Comma-separated genres')
     search_parser.add_argument('--match-all', action='store_true', help='Match all genres')
@@ -69,19 +96,81 @@ Examples:
     search_parser.add_argument('--year', type=int, help='Release year')
     search_parser.add_argument('--limit', type=int, default=20, help='Maximum results')
     search_parser.add_argument('--show-all', action='store_true', help='Show all results')
-    
-    # Export command
+
+
+def _build_export_parser(subparsers):
     export_parser = subparsers.add_parser('export', help='Export data')
     export_parser.add_argument('--format', '-f', choices=['csv', 'json', 'sqlite'], default='csv', help='Export format')
     export_parser.add_argument('--output', '-o', required=True, help='Output file path')
     export_parser.add_argument('--genres', help='Filter by genres')
-    
-    # Stats command
-    stats_parser = subparsers.add_parser('stats', help='Show database statistics')
-    
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize database')
-    
+
+
+def _build_stats_parser(subparsers):
+    subparsers.add_parser('stats', help='Show database statistics')
+
+
+def _build_init_parser(subparsers):
+    subparsers.add_parser('init', help='Initialize database')
+
+
+_SUBPARSER_BUILDERS = {
+    'crawl': _build_crawl_parser,
+    'scrape': _build_scrape_parser,
+    'list-genres': _build_list_genres_parser,
+    'search': _build_search_parser,
+    'export': _build_export_parser,
+    'stats': _build_stats_parser,
+    'init': _build_init_parser,
+}
+
+
+def _sniff_subcommand(argv):
+    """Return the first non-flag argument (the likely subcommand)"""
+    for arg in argv[1:]:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
+def main():
+    """Main CLI entry point"""
+    # Fast-path version before any argparse construction; printing a
+    # string should not pay for building the parser tree
+    if len(sys.argv) == 2 and sys.argv[1] in ('-v', '--version'):
+        from cli import __version__
+        print(f"aoty-crawler {__version__}")
+        return 0
+
+    # Configure logging lazily so importing this module configures
+    # nothing, and skip it when the embedding process already has
+    # handlers installed
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+    parser = argparse.ArgumentParser(
+        description='AOTY Crawler - Music Data Collection Tool',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+    )
+
+    from cli import __version__
+    parser.add_argument('--version', '-v', action='version',
+                        version=f'aoty-crawler {__version__}')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # Build only the requested command's subparser; fall back to the
+    # full tree for help, bare runs and unknown commands
+    command = _sniff_subcommand(sys.argv)
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
     
     if not args.command:
@@ -111,39 +200,29 @@ Examples:
         logger.info("Operation cancelled by user")
         return 130
     except Exception as e:
-        logger.error(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # logger.exception reuses the configured formatter instead of
+        # hand-rolled traceback printing to stderr
+        logger.exception("Error: %s", e)
         return 1
 
 
 def cmd_crawl(args):
     """Handle crawl command - run a specific spider"""
-    logger.info(f"Running spider: {args.spider}")
+    logger.info("Running spider: %s", args.spider)
     
     # Import Scrapy components
     from scrapy.crawler import CrawlerProcess
-    from scrapy.utils.project import get_project_settings
-    from aoty_crawler.spiders import TestSpider, HtmlDebugSpider, GenreTestSpider, ComprehensiveAlbumSpider, ProductionSpider, ProductionTestSpider, AlbumSpider, ArtistSpider, GenreSpider, YearSpider
-    
-    # Map spider names to classes
-    spider_map = {
-        'html_debug': HtmlDebugSpider,
-        'genre_test': GenreTestSpider,
-        'comprehensive_album': ComprehensiveAlbumSpider,
-        'production': ProductionSpider,
-        'production_test': ProductionTestSpider,
-    }
-    
+
     # Get spider class
+    spider_map = _spider_map()
     spider_class = spider_map.get(args.spider)
     if not spider_class:
-        logger.error(f"Unknown spider: {args.spider}")
-        logger.info(f"Available spiders: {', '.join(spider_map.keys())}")
+        logger.error("Unknown spider: %s", args.spider)
+        logger.info("Available spiders: %s", ', '.join(spider_map.keys()))
         return 1
-    
+
     # Get settings
-    settings = get_project_settings()
+    settings = _scrapy_settings()
     
     # Create crawler process
     process = CrawlerProcess(settings)
@@ -152,10 +231,10 @@ def cmd_crawl(args):
     process.crawl(spider_class)
     
     # Start scraping
-    logger.info(f"Starting {args.spider} spider...")
+    logger.info("Starting %s spider...", args.spider)
     process.start()
     
-    logger.info(f"{args.spider} spider completed!")
+    logger.info("%s spider completed!", args.spider)
     return 0
 
 
@@ -165,23 +244,23 @@ def cmd_scrape(args):
     
     # Import Scrapy components
     from scrapy.crawler import CrawlerProcess
-    from scrapy.utils.project import get_project_settings
-    from aoty_crawler.spiders import ProductionSpider
-    
+
+    ProductionSpider = _spider_map()['production']
+
     # Get settings
-    settings = get_project_settings()
+    settings = _scrapy_settings()
     
     # Configure output directory if specified
     if args.output_dir:
         output_dir = os.path.abspath(args.output_dir)
         settings.set('OUTPUT_DIR', output_dir, priority='cmdline')
-        logger.info(f"Output directory: {output_dir}")
+        logger.info("Output directory: %s", output_dir)
     
     # Configure for test mode
     if args.test_mode:
         settings.set('DOWNLOAD_DELAY', 0.5, priority='cmdline')
         settings.set('CONCURRENT_REQUESTS', 4, priority='cmdline')
-        logger.info(f"Test mode: limiting to {args.limit} items per year")
+        logger.info("Test mode: limiting to %s items per year", args.limit)
     
     # Create crawler process
     process = CrawlerProcess(settings)
@@ -194,24 +273,24 @@ def cmd_scrape(args):
     # Add genre if specified
     if args.genre:
         spider_kwargs['genre'] = args.genre
-        logger.info(f"Scraping genre: {args.genre}")
+        logger.info("Scraping genre: %s", args.genre)
     
     # Add year parameters - always pass them
     if args.start_year:
         spider_kwargs['start_year'] = args.start_year
-        logger.info(f"Starting year: {args.start_year}")
+        logger.info("Starting year: %s", args.start_year)
     
     # Always pass years_back and albums_per_year
     spider_kwargs['years_back'] = args.years_back
-    logger.info(f"Years back: {args.years_back}")
+    logger.info("Years back: %s", args.years_back)
     
     # Use limit for test mode, otherwise use albums_per_year
     if args.test_mode:
         spider_kwargs['albums_per_year'] = args.limit
-        logger.info(f"Test mode: limiting to {args.limit} albums per year")
+        logger.info("Test mode: limiting to %s albums per year", args.limit)
     else:
         spider_kwargs['albums_per_year'] = args.albums_per_year
-        logger.info(f"Albums per year: {args.albums_per_year}")
+        logger.info("Albums per year: %s", args.albums_per_year)
     
     # Add resume parameters
     if args.resume:
@@ -219,7 +298,7 @@ def cmd_scrape(args):
         logger.info("Resume mode enabled")
         if args.resume_file:
             spider_kwargs['resume_file'] = args.resume_file
-            logger.info(f"Resume file: {args.resume_file}")
+            logger.info("Resume file: %s", args.resume_file)
     
     # Add production spider
     process.crawl(ProductionSpider, **spider_kwargs)
@@ -251,138 +330,189 @@ def cmd_search(args):
     logger.info("Searching database...")
     
     # Import database models
-    from database.models import (
-        Album, Artist, Genre, Review, get_session, create_database_engine
-    )
-    from sqlalchemy import or_, and_
-    
-    # Create database session
-    engine = create_database_engine()
-    session = get_session(engine)
-    
+    from database.models import Album, Artist, Genre, album_genres
+    from sqlalchemy import select, func
+    from sqlalchemy.orm import joinedload, selectinload
+    from cli.db import session_scope
+
     try:
-        # Build query
-        query = session.query(Album).join(Artist)
-        
-        # Apply filters
-        if args.genres:
-            genres = [g.strip() for g in args.genres.split(',')]
-            if args.match_all:
-                # Match albums with ALL specified genres
-                for genre_name in genres:
-                    query = query.join(Genre, Album.genres).filter(Genre.name == genre_name)
-            else:
-                # Match albums with ANY of the specified genres
-                genre_conditions = [Album.genres.any(Genre.name == g) for g in genres]
-                query = query.filter(or_(*genre_conditions))
-        
-        if args.min_score:
-            query = query.filter(Album.critic_score >= args.min_score)
-        
-        if args.max_score:
-            query = query.filter(Album.critic_score <= args.max_score)
-        
-        if args.min_reviews:
-            query = query.filter(Album.review_count >= args.min_reviews)
-        
-        if args.year:
-            from datetime import datetime
-            start_date = datetime(args.year, 1, 1)
-            end_date = datetime(args.year, 12, 31)
-            query = query.filter(Album.release_date >= start_date, Album.release_date <= end_date)
-        
-        # Execute query
-        results = query.limit(args.limit).all()
-        
-        # Display results
-        if not results:
-            logger.info("No albums found matching your criteria.")
+        with session_scope() as session:
+            # Build query; eager-load artist and genres so the display
+            # loop reads them without one lazy SELECT per album
+            query = (session.query(Album).join(Artist)
+                     .options(joinedload(Album.artist), selectinload(Album.genres)))
+
+            # Apply filters
+            if args.genres:
+                # Strip, drop empties and dedupe once; duplicates would
+                # skew the match-all distinct count below
+                genres = sorted({g.strip() for g in args.genres.split(',') if g.strip()})
+                if args.match_all:
+                    # Match albums with ALL specified genres via
+                    # relational division on the association table: one
+                    # grouped subquery instead of an EXISTS per genre
+                    genre_ids = select(Genre.id).where(Genre.name.in_(genres))
+                    has_all = (
+                        select(album_genres.c.album_id)
+                        .where(album_genres.c.genre_id.in_(genre_ids))
+                        .group_by(album_genres.c.album_id)
+                        .having(func.count(album_genres.c.genre_id.distinct()) == len(genres))
+                    )
+                    query = query.filter(Album.id.in_(has_all))
+                else:
+                    # Match albums with ANY of the specified genres: one
+                    # IN-subquery instead of an EXISTS per genre
+                    query = query.filter(Album.genres.any(Genre.name.in_(genres)))
+
+            if args.min_score:
+                query = query.filter(Album.critic_score >= args.min_score)
+
+            if args.max_score:
+                query = query.filter(Album.critic_score <= args.max_score)
+
+            if args.min_reviews:
+                query = query.filter(Album.review_count >= args.min_reviews)
+
+            if args.year:
+                from datetime import datetime
+                start_date = datetime(args.year, 1, 1)
+                end_date = datetime(args.year, 12, 31)
+                query = query.filter(Album.release_date >= start_date, Album.release_date <= end_date)
+
+            # Execute query
+            results = query.limit(args.limit).all()
+
+            # Display results
+            if not results:
+                logger.info("No albums found matching your criteria.")
+                return 0
+
+            logger.info("Found %d albums:", len(results))
+            logger.info("-" * 80)
+
+            # One buffered write instead of six prints per album; each
+            # print formats, takes the stdout lock, and issues its own
+            # write
+            lines = []
+            for album in results:
+                lines.append(
+                    f"🎵 {album.title}\n"
+                    f"   Artist: {album.artist.name}\n"
+                    f"   Score: {album.critic_score}/100 (Critic), {album.user_score}/100 (User)\n"
+                    f"   Reviews: {album.review_count}\n"
+                    f"   Year: {album.release_date.year if album.release_date else 'Unknown'}\n"
+                    f"   Genres: {', '.join(g.name for g in album.genres)}\n"
+                )
+            sys.stdout.write('\n'.join(lines) + '\n')
+
             return 0
-        
-        logger.info(f"Found {len(results)} albums:")
-        logger.info("-" * 80)
-        
-        for album in results:
-            print(f"🎵 {album.title}")
-            print(f"   Artist: {album.artist.name}")
-            print(f"   Score: {album.critic_score}/100 (Critic), {album.user_score}/100 (User)")
-            print(f"   Reviews: {album.review_count}")
-            print(f"   Year: {album.release_date.year if album.release_date else 'Unknown'}")
-            print(f"   Genres: {', '.join(g.name for g in album.genres)}")
-            print()
-        
-        return 0
-        
+
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.error("Search error: %s", e)
         return 1
-    finally:
-        session.close()
 
 
 def cmd_export(args):
     """Handle export command"""
-    logger.info(f"Exporting data to {args.output}...")
+    logger.info("Exporting data to %s...", args.output)
     
     # Import database models
-    from database.models import (
-        Album, Artist, Genre, Review, get_session, create_database_engine
-    )
-    import pandas as pd
-    
-    # Create database session
-    engine = create_database_engine()
-    session = get_session(engine)
-    
+    from datetime import datetime
+    from database.models import Album, Artist, Genre, album_genres
+    from sqlalchemy import select, func, cast, Integer
+    from cli.db import get_engine
+
+    # Shared, process-cached engine
+    engine = get_engine()
+
     try:
-        # Get all albums
-        albums = session.query(Album).all()
-        
-        if not albums:
+        # One joined, grouped query streamed row-by-row from the cursor:
+        # no per-album ORM objects, no lazy loads, and no pandas
+        # DataFrame sitting in memory while the file is written
+        query = (
+            select(
+                Album.title,
+                Artist.name.label('artist'),
+                Album.critic_score,
+                Album.user_score,
+                Album.review_count,
+                cast(func.strftime('%Y', Album.release_date), Integer).label('release_year'),
+                func.group_concat(Genre.name, ', ').label('genres'),
+                Album.url,
+                Album.scraped_at,
+            )
+            .join(Artist, Album.artist_id == Artist.id)
+            .outerjoin(album_genres, album_genres.c.album_id == Album.id)
+            .outerjoin(Genre, Genre.id == album_genres.c.genre_id)
+            .group_by(Album.id)
+        )
+
+        count = 0
+        with engine.connect().execution_options(stream_results=True) as conn:
+            result = conn.execute(query)
+            columns = list(result.keys())
+
+            if args.format == 'csv':
+                import csv
+                with open(args.output, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    for row in result:
+                        writer.writerow(row)
+                        count += 1
+            elif args.format == 'json':
+                try:
+                    # Serialize with orjson when available - much faster
+                    # than stdlib json on large exports
+                    import orjson
+                    _dumps = lambda obj: orjson.dumps(obj, default=str)
+                except ImportError:
+                    import json
+                    _dumps = lambda obj: json.dumps(obj, default=str).encode('utf-8')
+
+                with open(args.output, 'wb') as f:
+                    f.write(b'[')
+                    for row in result:
+                        if count:
+                            f.write(b',\n')
+                        f.write(_dumps(dict(row._mapping)))
+                        count += 1
+                    f.write(b']\n')
+            elif args.format == 'sqlite':
+                # Export to a new SQLite database in one bulk
+                # transaction; datetimes go in as strings since sqlite3
+                # has no native binding for them
+                import sqlite3
+                out = sqlite3.connect(args.output)
+                try:
+                    out.executescript('PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY;')
+                    col_sql = ', '.join(f'"{c}"' for c in columns)
+                    placeholders = ', '.join('?' for _ in columns)
+                    out.execute('DROP TABLE IF EXISTS albums')
+                    out.execute(f'CREATE TABLE albums ({col_sql})')
+
+                    def _rows():
+                        nonlocal count
+                        for row in result:
+                            count += 1
+                            yield tuple(str(v) if isinstance(v, datetime) else v
+                                        for v in row)
+
+                    out.executemany(f'INSERT INTO albums VALUES ({placeholders})', _rows())
+                    out.commit()
+                finally:
+                    out.close()
+
+        if not count:
             logger.info("No albums found to export.")
             return 0
-        
-        # Prepare data for export
-        data = []
-        for album in albums:
-            album_data = {
-                'title': album.title,
-                'artist': album.artist.name if album.artist else 'Unknown',
-                'critic_score': album.critic_score,
-                'user_score': album.user_score,
-                'review_count': album.review_count,
-                'release_year': album.release_date.year if album.release_date else None,
-                'genres': ', '.join(g.name for g in album.genres),
-                'url': album.url,
-                'scraped_at': album.scraped_at
-            }
-            data.append(album_data)
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
-        # Export based on format
-        if args.format == 'csv':
-            df.to_csv(args.output, index=False)
-            logger.info(f"Exported {len(df)} albums to CSV: {args.output}")
-        elif args.format == 'json':
-            df.to_json(args.output, orient='records', indent=2)
-            logger.info(f"Exported {len(df)} albums to JSON: {args.output}")
-        elif args.format == 'sqlite':
-            # Export to new SQLite database
-            import sqlite3
-            conn = sqlite3.connect(args.output)
-            df.to_sql('albums', conn, index=False, if_exists='replace')
-            conn.close()
-            logger.info(f"Exported {len(df)} albums to SQLite: {args.output}")
-        
+
+        logger.info("Exported %d albums to %s: %s", count, args.format.upper(), args.output)
         return 0
-        
+
     except Exception as e:
-        logger.error(f"Export error: {e}")
+        logger.error("Export error: %s", e)
         return 1
-    finally:
-        session.close()
 
 
 def cmd_stats(args):
@@ -391,53 +521,57 @@ def cmd_stats(args):
     logger.info("=" * 40)
     
     # Import database models
-    from database.models import (
-        Album, Artist, Genre, Review, get_session, create_database_engine
-    )
-    
-    # Create database session
-    engine = create_database_engine()
-    session = get_session(engine)
-    
+    from database.models import Album, Artist, Genre, Review
+    from sqlalchemy import func
+    from sqlalchemy.orm import joinedload
+    from cli.db import session_scope
+
     try:
-        # Get counts
-        album_count = session.query(Album).count()
-        artist_count = session.query(Artist).count()
-        genre_count = session.query(Genre).count()
-        review_count = session.query(Review).count()
-        
-        # Get average scores
-        avg_critic_score = session.query(Album.critic_score).filter(Album.critic_score != None).average()
-        avg_user_score = session.query(Album.user_score).filter(Album.user_score != None).average()
-        
-        # Get top albums
-        top_albums = session.query(Album).order_by(Album.critic_score.desc()).limit(5).all()
-        
-        # Display statistics
-        logger.info(f"Albums: {album_count}")
-        logger.info(f"Artists: {artist_count}")
-        logger.info(f"Genres: {genre_count}")
-        logger.info(f"Reviews: {review_count}")
-        
-        if avg_critic_score:
-            logger.info(f"Average Critic Score: {avg_critic_score:.1f}")
-        if avg_user_score:
-            logger.info(f"Average User Score: {avg_user_score:.1f}")
-        
-        # Display top albums
-        if top_albums:
-            logger.info("\nTop 5 Albums by Critic Score:")
-            for i, album in enumerate(top_albums, 1):
-                artist_name = album.artist.name if album.artist else 'Unknown'
-                logger.info(f"{i}. {album.title} by {artist_name} ({album.critic_score}/100)")
-        
-        return 0
-        
+        with session_scope() as session:
+            # All counts and averages in one round-trip via scalar
+            # subqueries; AVG skips NULL scores by itself. The old code
+            # issued six queries and called a nonexistent .average()
+            (album_count, artist_count, genre_count, review_count,
+             avg_critic_score, avg_user_score) = session.query(
+                session.query(func.count(Album.id)).scalar_subquery(),
+                session.query(func.count(Artist.id)).scalar_subquery(),
+                session.query(func.count(Genre.id)).scalar_subquery(),
+                session.query(func.count(Review.id)).scalar_subquery(),
+                session.query(func.avg(Album.critic_score)).scalar_subquery(),
+                session.query(func.avg(Album.user_score)).scalar_subquery(),
+            ).one()
+
+            # Get top albums, with artists joined in the same SELECT
+            # instead of one lazy load per row
+            top_albums = (session.query(Album)
+                          .options(joinedload(Album.artist))
+                          .order_by(Album.critic_score.desc())
+                          .limit(5).all())
+
+            # Display statistics
+            logger.info("Albums: %s", album_count)
+            logger.info("Artists: %s", artist_count)
+            logger.info("Genres: %s", genre_count)
+            logger.info("Reviews: %s", review_count)
+
+            if avg_critic_score:
+                logger.info("Average Critic Score: %.1f", avg_critic_score)
+            if avg_user_score:
+                logger.info("Average User Score: %.1f", avg_user_score)
+
+            # Display top albums
+            if top_albums:
+                lines = ["\nTop 5 Albums by Critic Score:"]
+                for i, album in enumerate(top_albums, 1):
+                    artist_name = album.artist.name if album.artist else 'Unknown'
+                    lines.append(f"{i}. {album.title} by {artist_name} ({album.critic_score}/100)")
+                logger.info('\n'.join(lines))
+
+            return 0
+
     except Exception as e:
-        logger.error(f"Stats error: {e}")
+        logger.error("Stats error: %s", e)
         return 1
-    finally:
-        session.close()
 
 
 def cmd_init(args):
@@ -450,7 +584,7 @@ def cmd_init(args):
         logger.info("Database initialized successfully!")
         return 0
     except Exception as e:
-        logger.error(f"Initialization error: {e}")
+        logger.error("Initialization error: %s", e)
         return 1
 
 
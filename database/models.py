@@ -1,7 +1,7 @@
 # Database models for AOTY Crawler
 # SQLAlchemy ORM models for the database
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, Table, Index
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, ForeignKey, Table, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime
@@ -14,7 +14,10 @@ album_genres = Table(
     'album_genres',
     Base.metadata,
     Column('album_id', Integer, ForeignKey('albums.id', ondelete='CASCADE'), primary_key=True),
-    Column('genre_id', Integer, ForeignKey('genres.id', ondelete='CASCADE'), primary_key=True)
+    Column('genre_id', Integer, ForeignKey('genres.id', ondelete='CASCADE'), primary_key=True),
+    # The composite primary key is (album_id, genre_id); genre-first
+    # filters need the reversed ordering to be index-driven
+    Index('idx_album_genres_genre_album', 'genre_id', 'album_id')
 )
 
 
@@ -41,12 +44,18 @@ class Album(Base):
     genres = relationship("Genre", secondary=album_genres, back_populates="albums")
     reviews = relationship("Review", back_populates="album", cascade="all, delete-orphan")
     
-    # Indexes for performance
+    # Indexes for performance. The composite indexes serve the
+    # "top N by score within a release window" queries: SQLite can
+    # answer them with an index-only walk instead of a bitmap merge of
+    # the single-column indexes plus per-row fetches.
     __table_args__ = (
         Index('idx_albums_critic_score', 'critic_score'),
         Index('idx_albums_user_score', 'user_score'),
         Index('idx_albums_review_count', 'review_count'),
         Index('idx_albums_release_date', 'release_date'),
+        Index('idx_albums_release_user_score', 'release_date', 'user_score'),
+        Index('idx_albums_release_scores_cover', 'release_date', 'critic_score',
+              'user_score', 'review_count'),
     )
 
 
@@ -149,9 +158,41 @@ def create_database_engine(database_url=None):
             os.makedirs(db_dir)
     
     engine = create_engine(database_url, echo=False)
+
+    # WAL keeps readers unblocked during bulk writes and NORMAL sync is
+    # safe under WAL; both pragmas are per-connection, so set them on
+    # every connection the pool hands out
+    if database_url.startswith('sqlite'):
+        @event.listens_for(engine, 'connect')
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
     return engine
 
 
+def bulk_insert_albums(engine, rows, genre_rows=None):
+    """Insert album rows (and optional album-genre links) in bulk
+
+    Core executemany skips the per-row ORM bookkeeping (identity map,
+    attribute instrumentation, one flush round-trip per item) that
+    session.add pays, so large loads are bounded by sqlite3 insert
+    throughput instead of Python overhead. `rows` is a list of dicts
+    keyed by Album columns; `genre_rows` is an optional list of
+    {'album_id': ..., 'genre_id': ...} dicts for the association table.
+    """
+    if not rows and not genre_rows:
+        return
+
+    with engine.begin() as conn:
+        if rows:
+            conn.execute(Album.__table__.insert(), rows)
+        if genre_rows:
+            conn.execute(album_genres.insert(), genre_rows)
+
+
 def create_tables(engine):
     """Create all tables in the database"""
     Base.metadata.create_all(engine)